@@ -0,0 +1,26 @@
+import os
+import json
+import threading
+
+# Files that other threads or processes may read while they are rewritten
+# (ingestion manifests, LinkedIn session cookies, the vector index snapshot)
+# are written next to their final path and renamed into place, so a reader
+# sees either the old file or the new one, never a partial write.
+
+def write_atomic(path: str, write, mode: str = 'w') -> None:
+    """Write `path` by calling `write(f)` on a temporary file, then rename it."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, mode) as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def save_json(path: str, data) -> None:
+    write_atomic(path, lambda f: json.dump(data, f))
@@ -0,0 +1,226 @@
+"""Ingest many profiles from a CSV or JSONL file.
+
+Every row describes one person with the same fields main.py reads from the
+environment: name, email, github_username, linkedin_url, plus resume_path
+and an optional profile_id. Each profile goes through the scrape -> format
+-> embed -> store pipeline, with a separate cap on how many profiles may be
+in each stage at once.
+
+The output of every stage is checkpointed under
+<checkpoint-dir>/<profile_id>/, so a run that crashes or runs out of quota
+picks up where it stopped when started again. Profiles that already finished
+are skipped. Use --restart to begin a new run; the per-profile manifests are
+kept, so unchanged sources are still not re-formatted or re-embedded.
+
+    python batch_ingest.py people.csv --format-concurrency 4
+"""
+import os
+import re
+import csv
+import sys
+import json
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dotenv import load_dotenv
+import config
+import metrics
+from main import (ingest_resume, ingest_linkedin, ingest_github, build_final_data,
+                  diff_chunks, embed_chunks, store_chunks)
+from gemini_client import configure_gemini, get_llm_cache
+from github_scraper import fetch_github_repositories
+from linkedin_scraper import scrape_profile
+from browser_pool import BrowserPool
+from fingerprints import load_manifest, save_manifest
+
+# Load environment variables
+load_dotenv()
+
+FIELDS = ('name', 'email', 'github_username', 'linkedin_url', 'resume_path', 'profile_id')
+STAGES = ('scrape', 'format', 'embed', 'store')
+
+# Stand-in for a source the profile does not have
+EMPTY_UNIT = {"fingerprint": None, "formatted": {}}
+
+def read_profiles(path):
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        if path.lower().endswith(('.jsonl', '.ndjson')):
+            rows = [json.loads(line) for line in f if line.strip()]
+        else:
+            rows = list(csv.DictReader(f))
+
+    profiles = {}
+    for row in rows:
+        profile = {field: (row.get(field) or '').strip() for field in FIELDS}
+        profile['profile_id'] = profile['profile_id'] or profile['github_username'] or profile['email']
+        if not profile['profile_id']:
+            print(f"Skipping a row without profile_id, github_username or email: {row}")
+        elif profile['profile_id'] in profiles:
+            print(f"Skipping a duplicate row for {profile['profile_id']}")
+        else:
+            profiles[profile['profile_id']] = profile
+    return list(profiles.values())
+
+def safe_name(profile_id):
+    return re.sub(r'[^A-Za-z0-9._@-]', '_', profile_id)
+
+
+class BatchIngestor:
+    """Runs the ingestion pipeline for many profiles with per-stage limits.
+
+    Each profile is driven through the stages by one worker thread; a stage
+    semaphore caps how many workers are inside that stage at a time, so for
+    example scraping can run two browsers while formatting keeps more Gemini
+    requests in flight (still paced by the shared Gemini limiter).
+    """
+
+    def __init__(self, checkpoint_dir, concurrency):
+        self.checkpoint_dir = checkpoint_dir
+        self.limits = {stage: threading.BoundedSemaphore(max(1, concurrency[stage])) for stage in STAGES}
+        self.workers = sum(max(1, concurrency[stage]) for stage in STAGES)
+        self.linkedin_pool = BrowserPool(size=max(1, concurrency['scrape']))
+        self.stage_seconds = {stage: 0.0 for stage in STAGES}
+        self._stats_lock = threading.Lock()
+
+    def profile_dir(self, profile):
+        return os.path.join(self.checkpoint_dir, safe_name(profile['profile_id']))
+
+    def checkpoint_path(self, profile, name):
+        return os.path.join(self.profile_dir(profile), f"{name}.json")
+
+    def run_stage(self, stage, profile, compute):
+        # Reuse the checkpoint of a stage that already finished in an earlier run
+        path = self.checkpoint_path(profile, stage)
+        if os.path.exists(path):
+            return load_manifest(path)
+
+        with self.limits[stage]:
+            start = time.perf_counter()
+            output = compute()
+            elapsed = time.perf_counter() - start
+        save_manifest(path, output)
+        with self._stats_lock:
+            self.stage_seconds[stage] += elapsed
+        return output
+
+    def scrape(self, profile):
+        github_repos = fetch_github_repositories(profile['github_username']) if profile['github_username'] else []
+        if github_repos is None:
+            # Raised rather than checkpointed, so the next run fetches again
+            # instead of storing the profile without its repositories
+            raise RuntimeError("fetching GitHub repositories failed")
+        linkedin_data = {}
+        if profile['linkedin_url']:
+            with self.linkedin_pool.driver() as driver:
+                linkedin_data = scrape_profile(driver, profile['linkedin_url'])
+        return {"github": github_repos, "linkedin": linkedin_data}
+
+    def format_profile(self, profile, scraped, manifest):
+        if profile['resume_path']:
+            resume_unit = ingest_resume(profile['resume_path'], manifest.get("resume", {}))
+        else:
+            resume_unit = EMPTY_UNIT
+        linkedin_unit = ingest_linkedin(scraped["linkedin"], manifest.get("linkedin", {})) if scraped["linkedin"] else EMPTY_UNIT
+        github_unit = ingest_github(scraped["github"], manifest.get("github", {}))
+
+        user_data = {field: profile[field] for field in ('name', 'email', 'github_username', 'linkedin_url')}
+        final_data = build_final_data(user_data, resume_unit, linkedin_unit, github_unit)
+        return {"units": {"resume": resume_unit, "linkedin": linkedin_unit, "github": github_unit},
+                "final_data": final_data}
+
+    def embed(self, formatted, manifest):
+        current_chunks, changed_chunks, removed_ids = diff_chunks(formatted["final_data"], manifest.get("chunks", {}))
+        documents = embed_chunks(changed_chunks)
+        if documents is None:
+            raise RuntimeError("embedding failed")
+        return {"chunks": current_chunks, "documents": documents, "removed_ids": removed_ids}
+
+    def store(self, profile, formatted, embedded):
+        if embedded["documents"] or embedded["removed_ids"]:
+            store_chunks(profile['profile_id'], embedded["documents"], embedded["chunks"], embedded["removed_ids"])
+
+        with open(os.path.join(self.profile_dir(profile), "final_data.json"), 'w') as f:
+            json.dump(formatted["final_data"], f, indent=4)
+        # Only record the profile's new state once everything is stored
+        save_manifest(self.checkpoint_path(profile, "manifest"), {**formatted["units"], "chunks": embedded["chunks"]})
+        return {"stored": len(embedded["documents"]), "removed": len(embedded["removed_ids"])}
+
+    def ingest(self, profile):
+        manifest = load_manifest(self.checkpoint_path(profile, "manifest"))
+
+        scraped = self.run_stage("scrape", profile, lambda: self.scrape(profile))
+        formatted = self.run_stage("format", profile, lambda: self.format_profile(profile, scraped, manifest))
+        embedded = self.run_stage("embed", profile, lambda: self.embed(formatted, manifest))
+        return self.run_stage("store", profile, lambda: self.store(profile, formatted, embedded))
+
+    def reset(self, profiles):
+        # Forget the stage outputs of the previous run, keep the manifests
+        for profile in profiles:
+            for stage in STAGES:
+                try:
+                    os.remove(self.checkpoint_path(profile, stage))
+                except FileNotFoundError:
+                    pass
+
+    def run(self, profiles):
+        pending = [profile for profile in profiles if not os.path.exists(self.checkpoint_path(profile, "store"))]
+        skipped = len(profiles) - len(pending)
+        if skipped:
+            print(f"Skipping {skipped} profiles finished in an earlier run")
+
+        start = time.perf_counter()
+        done, failed = 0, []
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.workers, max(1, len(pending)))) as executor:
+                futures = {executor.submit(self.ingest, profile): profile for profile in pending}
+                for future in as_completed(futures):
+                    profile_id = futures[future]['profile_id']
+                    try:
+                        stored = future.result()
+                        done += 1
+                        elapsed = time.perf_counter() - start
+                        print(f"[{done + len(failed)}/{len(pending)}] {profile_id}: stored {stored['stored']} chunks, "
+                              f"removed {stored['removed']} ({done / elapsed * 60:.1f} profiles/min)")
+                    except Exception as e:
+                        failed.append(profile_id)
+                        print(f"[{done + len(failed)}/{len(pending)}] {profile_id} failed: {e}")
+        finally:
+            self.linkedin_pool.close()
+
+        elapsed = time.perf_counter() - start
+        rate = done / elapsed * 60 if elapsed else 0.0
+        print(f"Ingested {done}/{len(pending)} profiles in {elapsed:.1f}s ({rate:.1f} profiles/min)")
+        print("Time in stage: " + ", ".join(f"{stage} {seconds:.1f}s" for stage, seconds in self.stage_seconds.items()))
+        if get_llm_cache() is not None:
+            print(f"LLM response cache: {get_llm_cache().stats()}")
+        print(metrics.registry.summary_table())
+        if failed:
+            print(f"Failed: {', '.join(failed)}. Run again to resume them from their last finished stage.")
+        return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("profiles", help="CSV or JSONL file with one profile per row")
+    parser.add_argument("--checkpoint-dir", default=config.BATCH_CHECKPOINT_DIR,
+                        help=f"where stage outputs are kept (default {config.BATCH_CHECKPOINT_DIR})")
+    parser.add_argument("--restart", action="store_true", help="discard the stage outputs of the previous run")
+    for stage in STAGES:
+        default = getattr(config, f"BATCH_{stage.upper()}_CONCURRENCY")
+        parser.add_argument(f"--{stage}-concurrency", type=int, default=default,
+                            help=f"profiles in the {stage} stage at once (default {default})")
+    args = parser.parse_args()
+
+    profiles = read_profiles(args.profiles)
+    concurrency = {stage: getattr(args, f"{stage}_concurrency") for stage in STAGES}
+    ingestor = BatchIngestor(args.checkpoint_dir, concurrency)
+    if args.restart:
+        ingestor.reset(profiles)
+
+    configure_gemini()
+    failed = ingestor.run(profiles)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""Local HTTP server replaying the GitHub API calls made by github_scraper.
+
+Serves GET /users/<user>/repos (paginated with Link headers, like GitHub)
+and GET /repos/<user>/<repo>/readme for a synthetic account, or for the
+responses recorded in a JSON file of {"repos": [...], "readmes": {name: text}}.
+Point the scraper at it with GITHUB_API_URL:
+
+    python benchmarks/github_replay.py --repos 200 --port 8001
+    GITHUB_API_URL=http://127.0.0.1:8001 python main.py
+"""
+import json
+import time
+import base64
+import random
+import argparse
+import threading
+from urllib.parse import urlsplit, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+README_TEMPLATE = """# {name}
+
+[![Build](https://img.shields.io/badge/build-passing-green.svg)](https://ci.example.com/{name})
+[![Coverage](https://img.shields.io/badge/coverage-90%25-green.svg)](https://cov.example.com/{name})
+<p align="center"><img src="https://example.com/{name}/logo.png" width="200"/></p>
+
+{name} is a small project about {topic}.
+
+## Installation
+
+```bash
+pip install {name}
+```
+
+## Usage
+
+{body}
+
+| Option | Description |
+|--------|-------------|
+| --fast | Run faster |
+
+## License
+
+MIT, see [LICENSE](https://example.com/{name}/LICENSE).
+"""
+
+TOPICS = ["data pipelines", "web scraping", "vector search", "chat assistants", "PDF parsing", "dashboards"]
+
+def synthetic_account(repos=50, readme_paragraphs=8, seed=0):
+    rng = random.Random(seed)
+    repo_list, readmes = [], {}
+    for i in range(repos):
+        name = f"project-{i:03d}"
+        repo_list.append({
+            "name": name,
+            "description": f"Project number {i}" if i % 4 else None,
+            "languages_url": f"https://api.github.com/repos/test-user/{name}/languages",
+            "html_url": f"https://github.com/test-user/{name}",
+            "created_at": "2023-01-01T00:00:00Z",
+            "updated_at": f"2024-01-{1 + i % 28:02d}T00:00:00Z",
+        })
+        body = "\n\n".join(" ".join(rng.choice(TOPICS).split() * 10) for _ in range(rng.randint(1, readme_paragraphs)))
+        readmes[name] = README_TEMPLATE.format(name=name, topic=rng.choice(TOPICS), body=body)
+    return {"repos": repo_list, "readmes": readmes}
+
+
+class GitHubReplayServer:
+    """Background server; use as a context manager or call start()/stop()."""
+
+    def __init__(self, account, latency=0.0, host="127.0.0.1", port=0):
+        self.account = account
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        replay = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def send_json(self, status, body, headers=None):
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):  # noqa: N802 - http.server API
+                with replay._lock:
+                    replay.requests += 1
+                if replay.latency:
+                    time.sleep(replay.latency)
+                parts = urlsplit(self.path)
+                segments = [segment for segment in parts.path.split("/") if segment]
+
+                if len(segments) == 3 and segments[0] == "users" and segments[2] == "repos":
+                    query = parse_qs(parts.query)
+                    per_page = int(query.get("per_page", ["30"])[0])
+                    page = int(query.get("page", ["1"])[0])
+                    repos = replay.account["repos"]
+                    headers = {}
+                    if page * per_page < len(repos):
+                        next_url = f"{replay.url}{parts.path}?per_page={per_page}&page={page + 1}"
+                        headers["Link"] = f'<{next_url}>; rel="next"'
+                    self.send_json(200, repos[(page - 1) * per_page:page * per_page], headers)
+                elif len(segments) == 4 and segments[0] == "repos" and segments[3] == "readme":
+                    readme = replay.account["readmes"].get(segments[2])
+                    if readme is None:
+                        self.send_json(404, {"message": "Not Found"})
+                    else:
+                        self.send_json(200, {"content": base64.b64encode(readme.encode("utf-8")).decode("ascii")})
+                else:
+                    self.send_json(404, {"message": "Not Found"})
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repos", type=int, default=50, help="synthetic repositories (default 50)")
+    parser.add_argument("--recorded", help="JSON file with recorded repos and readmes to serve instead")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--port", type=int, default=8001)
+    args = parser.parse_args()
+
+    if args.recorded:
+        with open(args.recorded, "r", encoding="utf-8") as f:
+            account = json.load(f)
+    else:
+        account = synthetic_account(args.repos)
+    server = GitHubReplayServer(account, latency=args.latency, port=args.port)
+    print(f"Serving {len(account['repos'])} repositories on {server.url}")
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Cold-start benchmark for the chat service.
+
+Imports the serving module (app) in fresh interpreters and reports the
+median import time next to the ingestion module (main), which app used to
+import. Fails when app pulls in any of the ingestion-only modules, or when
+--max-ms is given and the median import time goes over it.
+
+    python benchmarks/import_time.py --runs 5 --max-ms 1500
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules only the ingestion pipeline needs; none of them may load with app
+FORBIDDEN_MODULES = [
+    "main",
+    "github_scraper",
+    "linkedin_scraper",
+    "resume_parser",
+    "selenium",
+    "webdriver_manager",
+    "PyPDF2",
+    "pdfminer",
+]
+
+PROBE = """
+import sys, time, json
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+def measure(module: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module)],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def benchmark(module: str, runs: int):
+    samples = [measure(module) for _ in range(runs)]
+    median_ms = statistics.median(sample["seconds"] for sample in samples) * 1000
+    return median_ms, samples[-1]["modules"]
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per module (default 5)")
+    parser.add_argument("--max-ms", type=float, default=None, help="fail if importing app takes longer than this")
+    parser.add_argument("--skip-baseline", action="store_true", help="do not time the ingestion module")
+    args = parser.parse_args()
+
+    app_ms, app_modules = benchmark("app", args.runs)
+    print(f"import app:  {app_ms:8.1f} ms (median of {args.runs})")
+
+    if not args.skip_baseline:
+        try:
+            main_ms, _ = benchmark("main", args.runs)
+            print(f"import main: {main_ms:8.1f} ms (ingestion path, previously pulled in by app)")
+            print(f"saved:       {main_ms - app_ms:8.1f} ms")
+        except RuntimeError as e:
+            print(f"import main: skipped ({e.args[0].splitlines()[0]})")
+
+    failed = False
+    leaked = [name for name in FORBIDDEN_MODULES
+              if any(loaded == name or loaded.startswith(name + ".") for loaded in app_modules)]
+    if leaked:
+        print(f"FAIL: app imports ingestion-only modules: {', '.join(leaked)}")
+        failed = True
+    if args.max_ms is not None and app_ms > args.max_ms:
+        print(f"FAIL: import app took {app_ms:.1f} ms, budget is {args.max_ms:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
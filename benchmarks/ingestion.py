@@ -0,0 +1,259 @@
+"""Offline end-to-end benchmark of the ingestion pipeline.
+
+Runs every ingestion stage, then main.main() itself, against local
+stand-ins instead of the live services:
+
+- GitHub: a local server replaying a synthetic account (github_replay.py)
+- LinkedIn: the saved pages in benchmarks/fixtures/linkedin
+- resumes: generated text PDFs
+- Gemini: FakeGenAI with configurable latency and error rate (stand_ins.py)
+- MongoDB: an in-memory client (stand_ins.py)
+
+Reports wall time, throughput and peak Python memory (tracemalloc) per
+stage. Save the results with --json to compare commits:
+
+    python benchmarks/ingestion.py --repos 100 --llm-latency 0.5 --json before.json
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import tracemalloc
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import config  # noqa: E402
+import metrics  # noqa: E402
+import gemini_client  # noqa: E402
+import mongodb_connector  # noqa: E402
+import main as pipeline  # noqa: E402
+from github_scraper import fetch_github_repositories  # noqa: E402
+from linkedin_scraper import get_section_urls  # noqa: E402
+from linkedin_parser import extract_page_text, extract_section_text_from_file  # noqa: E402
+from resume_parser import extract_resume_data, extract_resumes  # noqa: E402
+from fingerprints import load_manifest  # noqa: E402
+from stand_ins import FakeGenAI, InMemoryMongoClient, write_sample_pdf  # noqa: E402
+from github_replay import GitHubReplayServer, synthetic_account  # noqa: E402
+
+FIXTURES = os.path.join(ROOT, "benchmarks", "fixtures", "linkedin")
+LINKEDIN_URL = "https://www.linkedin.com/in/test-user/"
+
+def fixture_path(url):
+    # Map a LinkedIn URL onto the saved page under FIXTURES
+    path = url.split("linkedin.com/", 1)[1].split("?", 1)[0]
+    return os.path.join(FIXTURES, path, "index.html")
+
+def fetch_github_repos(username):
+    # fetch_github_repositories returns None when the fetch fails; record that
+    # as the stage's error, like batch_ingest does, instead of counting it
+    repos = fetch_github_repositories(username)
+    if repos is None:
+        raise RuntimeError("fetching GitHub repositories failed")
+    return repos
+
+def scrape_linkedin_fixture(linkedin_url):
+    # What scrape_profile() extracts, read from the saved pages instead of a browser
+    with open(fixture_path(linkedin_url), "r", encoding="utf-8") as f:
+        profile_data = {"Main Profile": extract_page_text(f.read())}
+    for section_name, section_url in get_section_urls(linkedin_url).items():
+        profile_data[section_name] = extract_section_text_from_file(fixture_path(section_url))
+    return profile_data
+
+
+class Benchmark:
+    def __init__(self, measure_memory=True):
+        self.measure_memory = measure_memory
+        self.results = []
+
+    def stage(self, name, run, count=None):
+        """Time `run()`; `count(result)` gives the number of items it processed."""
+        if self.measure_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        error, result = None, None
+        try:
+            result = run()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        seconds = time.perf_counter() - start
+        peak = None
+        if self.measure_memory:
+            peak = tracemalloc.get_traced_memory()[1] / (1 << 20)
+            tracemalloc.stop()
+
+        items = None
+        if count and error is None:
+            try:
+                items = count(result)
+            except Exception as e:
+                error = f"counting the result failed: {type(e).__name__}: {e}"
+        self.results.append({
+            "stage": name,
+            "seconds": seconds,
+            "items": items,
+            "items_per_second": items / seconds if items and seconds else None,
+            "peak_mib": peak,
+            "error": error,
+        })
+        return result
+
+    def print_table(self):
+        print(f"{'stage':<28}{'seconds':>10}{'items':>8}{'items/s':>10}{'peak MiB':>10}")
+        for row in self.results:
+            items = "" if row["items"] is None else str(row["items"])
+            rate = "" if row["items_per_second"] is None else f"{row['items_per_second']:.1f}"
+            peak = "" if row["peak_mib"] is None else f"{row['peak_mib']:.1f}"
+            print(f"{row['stage']:<28}{row['seconds']:>10.3f}{items:>8}{rate:>10}{peak:>10}")
+            if row["error"]:
+                print(f"  failed: {row['error']}")
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+def install_stand_ins(args, workdir, genai, mongo, github_url):
+    # Everything the pipeline reaches for goes to the stand-ins
+    gemini_client.get_genai = lambda: genai
+    gemini_client.GEMINI_API_KEY = "offline-benchmark"
+    mongodb_connector._client = mongo
+    pipeline.scrape_linkedin_profile = scrape_linkedin_fixture
+
+    config.GITHUB_API_URL = github_url
+    config.EMBEDDING_CACHE_PATH = ""
+    config.LLM_CACHE_ENABLED = args.llm_cache
+    config.LLM_CACHE_PATH = os.path.join(workdir, "llm_responses.sqlite3")
+    config.INGEST_MANIFEST_PATH = os.path.join(workdir, "ingest_manifest.json")
+    config.VECTOR_INDEX_PATH = os.path.join(workdir, "vector_index")
+
+    # Fresh limiters that start at the requested rate and back off on the
+    # fake 429s, retried quickly so error-rate runs stay short
+    config.GEMINI_LIMITER_PATH = os.path.join(workdir, "gemini_limiter.sqlite3")
+    config.GEMINI_REQUESTS_PER_MINUTE = config.GEMINI_MAX_REQUESTS_PER_MINUTE = args.requests_per_minute
+    config.GEMINI_EMBED_REQUESTS_PER_MINUTE = config.GEMINI_EMBED_MAX_REQUESTS_PER_MINUTE = args.requests_per_minute
+    config.GEMINI_MIN_REQUESTS_PER_MINUTE = min(config.GEMINI_MIN_REQUESTS_PER_MINUTE, args.requests_per_minute)
+    config.GEMINI_BURST = args.burst
+    config.GEMINI_RETRY_BASE_DELAY = args.retry_delay
+    gemini_client._limiters.clear()
+
+    os.environ.update({
+        "USER_NAME": "Test User",
+        "USER_EMAIL": "test@example.com",
+        "GITHUB_USERNAME": "test-user",
+        "LINKEDIN_URL": LINKEDIN_URL,
+        "PROFILE_ID": "test-user",
+        "MONGO_DB_NAME": "benchmark",
+        "MONGO_CL_NAME": "profile",
+    })
+
+def run(args):
+    workdir = tempfile.mkdtemp(prefix="ingestion-benchmark-")
+    os.makedirs(os.path.join(workdir, "resources"))
+    resume_dir = os.path.join(workdir, "resumes")
+    os.makedirs(resume_dir)
+    for i in range(args.resumes):
+        write_sample_pdf(os.path.join(resume_dir, f"resume-{i:04d}.pdf"), args.resume_pages, seed=i)
+    write_sample_pdf(os.path.join(workdir, "resources", "Resume.pdf"), args.resume_pages)
+    large_pdf = os.path.join(workdir, "large.pdf")
+    write_sample_pdf(large_pdf, args.large_pdf_pages)
+
+    genai = FakeGenAI(latency=args.llm_latency, latency_per_1k_chars=args.llm_latency_per_1k_chars,
+                      error_rate=args.error_rate, seed=args.seed)
+    mongo = InMemoryMongoClient()
+    bench = Benchmark(measure_memory=not args.no_memory)
+    previous_cwd = os.getcwd()
+
+    with GitHubReplayServer(synthetic_account(args.repos, seed=args.seed), latency=args.github_latency) as github:
+        install_stand_ins(args, workdir, genai, mongo, github.url)
+        os.chdir(workdir)
+        try:
+            repos = bench.stage("github fetch", lambda: fetch_github_repos("test-user"), len) or []
+            linkedin_data = bench.stage("linkedin parse",
+                                        lambda: [scrape_linkedin_fixture(LINKEDIN_URL) for _ in range(args.linkedin_runs)],
+                                        lambda pages: len(pages) * (1 + len(get_section_urls(""))))
+            linkedin_data = (linkedin_data or [{}])[0]
+            bench.stage("resume extract (batch)", lambda: list(extract_resumes(resume_dir, max_workers=args.workers)), len)
+            bench.stage(f"resume extract ({args.large_pdf_pages} pages)",
+                        lambda: extract_resume_data(large_pdf, max_workers=args.workers), lambda _: args.large_pdf_pages)
+
+            calls_before = genai.stats["generate_calls"]
+            units = bench.stage("format", lambda: (
+                pipeline.ingest_resume(os.path.join("resources", "Resume.pdf"), {}),
+                pipeline.ingest_linkedin(linkedin_data, {}),
+                pipeline.ingest_github(repos, {}),
+            ), lambda _: genai.stats["generate_calls"] - calls_before)
+
+            if units:
+                user_data = {"name": "Test User", "email": "test@example.com",
+                             "github_username": "test-user", "linkedin_url": LINKEDIN_URL}
+                final_data = pipeline.build_final_data(user_data, *units)
+                current, changed, removed = pipeline.diff_chunks(final_data, {})
+                documents = bench.stage("embed", lambda: pipeline.embed_chunks(changed), len)
+                if documents:
+                    bench.stage("store", lambda: pipeline.store_chunks("bench-stages", documents, current, removed),
+                                lambda _: len(documents))
+
+            bench.stage("pipeline (first run)", pipeline.main, lambda _: 1)
+            bench.stage("pipeline (no changes)", pipeline.main, lambda _: 1)
+            chunks = len(load_manifest(config.INGEST_MANIFEST_PATH).get("chunks", {}))
+        finally:
+            os.chdir(previous_cwd)
+            github_requests = github.requests
+
+    if not args.keep:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    bench.print_table()
+    print()
+    print(metrics.registry.summary_table())
+    print(f"GitHub requests: {github_requests}, Gemini: {genai.stats}, chunks stored by main(): {chunks}")
+    return {
+        "revision": git_revision(),
+        "arguments": vars(args),
+        "stages": bench.results,
+        "gemini": genai.stats,
+        "github_requests": github_requests,
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repos", type=int, default=50, help="repositories in the GitHub account (default 50)")
+    parser.add_argument("--resumes", type=int, default=20, help="PDFs in the batch extraction stage (default 20)")
+    parser.add_argument("--resume-pages", type=int, default=2, help="pages per resume (default 2)")
+    parser.add_argument("--large-pdf-pages", type=int, default=64, help="pages of the single large PDF (default 64)")
+    parser.add_argument("--linkedin-runs", type=int, default=20, help="times the LinkedIn fixtures are parsed (default 20)")
+    parser.add_argument("--workers", type=int, help="resume extraction processes (default RESUME_PARSER_WORKERS)")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="seconds per fake Gemini call (default 0.05)")
+    parser.add_argument("--llm-latency-per-1k-chars", type=float, default=0.0,
+                        help="extra seconds per 1000 prompt characters (default 0)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of Gemini calls that fail with 429")
+    parser.add_argument("--github-latency", type=float, default=0.0, help="seconds added to each GitHub response")
+    parser.add_argument("--requests-per-minute", type=float, default=6000.0,
+                        help="Gemini starting and maximum rate during the run (default 6000, i.e. effectively unthrottled)")
+    parser.add_argument("--burst", type=int, default=10)
+    parser.add_argument("--retry-delay", type=float, default=0.05,
+                        help="base delay in seconds of the Gemini retry backoff (default 0.05)")
+    parser.add_argument("--llm-cache", action="store_true", help="keep the LLM response cache enabled")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc (it slows Python code down)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep", action="store_true", help="keep the temporary working directory")
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args()
+
+    results = run(args)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    return 1 if any(row["error"] for row in results["stages"]) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
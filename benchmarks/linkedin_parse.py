@@ -0,0 +1,46 @@
+"""Offline benchmark for LinkedIn page parsing.
+
+Parses saved LinkedIn pages with linkedin_parser (no browser needed) and
+reports the time per page. Defaults to the fixtures in
+benchmarks/fixtures/linkedin; pass your own saved .html files to measure
+real pages.
+
+    python benchmarks/linkedin_parse.py --repeat 200 saved_skills.html
+"""
+import os
+import sys
+import glob
+import time
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from linkedin_parser import PARSER, extract_card_texts  # noqa: E402
+
+FIXTURES = os.path.join(ROOT, "benchmarks", "fixtures", "linkedin")
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*", help="saved HTML pages (default: the bundled fixtures)")
+    parser.add_argument("--repeat", type=int, default=100, help="parses per page (default 100)")
+    args = parser.parse_args()
+
+    paths = args.paths or sorted(glob.glob(os.path.join(FIXTURES, "**", "*.html"), recursive=True))
+    print(f"parser: {PARSER}")
+    total = 0.0
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            cards = extract_card_texts(html)
+        elapsed = (time.perf_counter() - start) / args.repeat
+        total += elapsed
+        print(f"{elapsed * 1000:8.3f} ms  {len(cards):3d} cards  {len(html) / 1024:7.1f} KiB  {os.path.relpath(path, ROOT)}")
+    if paths:
+        print(f"{total * 1000:8.3f} ms  total per pass over {len(paths)} pages")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+"""Local stand-ins for the external services used by the ingestion pipeline.
+
+- FakeGenAI replaces the google.generativeai module returned by
+  gemini_client.get_genai(): generate_content answers the format_* prompts
+  with plausible JSON and embed_content returns deterministic vectors, both
+  after a configurable latency and failing at a configurable rate.
+- InMemoryMongoClient replaces the pymongo client for the operations the
+  pipeline uses (bulk_write with ReplaceOne/DeleteMany, update_one, find).
+- write_sample_pdf() writes small text PDFs to stand in for resumes.
+"""
+import re
+import json
+import time
+import random
+import hashlib
+import threading
+import numpy as np
+
+try:
+    from google.api_core.exceptions import ResourceExhausted as QuotaError
+except ImportError:
+    class QuotaError(Exception):
+        code = 429
+
+EMBEDDING_DIMENSIONS = 768
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeGenAI:
+    """Module-like stand-in for google.generativeai.
+
+    `latency` is the seconds each call takes, plus `latency_per_1k_chars` for
+    every thousand prompt characters; `error_rate` is the fraction of calls
+    that raise a quota error (HTTP 429) instead of answering.
+    """
+
+    def __init__(self, latency=0.0, latency_per_1k_chars=0.0, error_rate=0.0, seed=0):
+        self.latency = latency
+        self.latency_per_1k_chars = latency_per_1k_chars
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {"generate_calls": 0, "embed_calls": 0, "embedded_texts": 0, "errors": 0, "prompt_chars": 0}
+
+    def configure(self, **kwargs):
+        pass
+
+    def GenerativeModel(self, model_name, generation_config=None):  # noqa: N802 - mirrors the genai API
+        return FakeModel(self, model_name)
+
+    def _call(self, kind, chars):
+        with self._lock:
+            self.stats[kind] += 1
+            self.stats["prompt_chars"] += chars
+            failed = self._random.random() < self.error_rate
+            if failed:
+                self.stats["errors"] += 1
+        time.sleep(self.latency + self.latency_per_1k_chars * chars / 1000)
+        if failed:
+            raise QuotaError("Resource has been exhausted (e.g. check quota).")
+
+    def embed_content(self, model, content, task_type=None):
+        texts = content if isinstance(content, list) else [content]
+        self._call("embed_calls", sum(len(text) for text in texts))
+        with self._lock:
+            self.stats["embedded_texts"] += len(texts)
+        embeddings = [fake_embedding(text) for text in texts]
+        return {"embedding": embeddings if isinstance(content, list) else embeddings[0]}
+
+
+class FakeModel:
+    def __init__(self, genai, model_name):
+        self.genai = genai
+        self.model_name = model_name
+
+    def generate_content(self, prompt, stream=False):
+        self.genai._call("generate_calls", len(prompt))
+        text = fake_answer(prompt)
+        if stream:
+            return [FakeResponse(text[start:start + 40]) for start in range(0, len(text), 40)]
+        return FakeResponse(text)
+
+
+def fake_embedding(text):
+    # Deterministic unit vector derived from the text
+    seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+    vector = np.random.default_rng(seed).standard_normal(EMBEDDING_DIMENSIONS).astype(np.float32)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+def fake_answer(prompt):
+    if "GitHub repositories data" in prompt:
+        names = re.findall(r'"name":"((?:[^"\\]|\\.)*)"', prompt)
+        return json.dumps({"repositories": [{
+            "name": name,
+            "description": f"{name} does something useful.",
+            "languages_used": ["Python"],
+            "creation_date": "2023-01-01",
+            "last_updated": "2024-01-01",
+        } for name in names]})
+    if "LinkedIn profile data" in prompt:
+        return json.dumps({
+            "full_name": "Test User",
+            "headline": "Software Engineer",
+            "location": "Remote",
+            "work_experience": [{"company_name": f"Company {i}", "designation": "Engineer",
+                                 "description": "Built services.", "start_date": "2020", "end_date": "2022"}
+                                for i in range(3)],
+            "education": [{"institution_name": "Test University", "degree": "BSc",
+                           "field_of_study": "Computer Science", "start_date": "2014", "end_date": "2018"}],
+            "skills": ["Python", "SQL"],
+            "certifications": [],
+            "honors_and_awards": [],
+        })
+    if "parsed resume data" in prompt:
+        return json.dumps({
+            "full_name": "Test User",
+            "email_address": "test@example.com",
+            "work_experience": [{"company_name": f"Company {i}", "designation": "Engineer",
+                                 "description": "Built services."} for i in range(3)],
+            "projects": [{"project_name": f"Project {i}", "description": "A project."} for i in range(2)],
+            "skills": ["Python", "SQL"],
+            "certifications": [],
+        })
+    return "This is a fake answer."
+
+
+class InMemoryCollection:
+    def __init__(self):
+        self.documents = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def matches(document, query):
+        for field, condition in query.items():
+            value = document.get(field)
+            if isinstance(condition, dict):
+                for operator, operand in condition.items():
+                    if operator == "$in" and value not in operand:
+                        return False
+                    if operator == "$nin" and value in operand:
+                        return False
+                    if operator == "$exists" and (field in document) != bool(operand):
+                        return False
+            elif value != condition:
+                return False
+        return True
+
+    def find(self, query=None, projection=None):
+        with self._lock:
+            return [dict(document) for document in self.documents.values() if self.matches(document, query or {})]
+
+    def find_one(self, query=None, projection=None):
+        found = self.find(query)
+        return found[0] if found else None
+
+    def update_one(self, query, update, upsert=False):
+        with self._lock:
+            document = next((d for d in self.documents.values() if self.matches(d, query)), None)
+            if document is None and upsert:
+                document = dict(query)
+                self.documents[document["_id"]] = document
+            if document is not None:
+                document.update(update.get("$set", {}))
+
+    def bulk_write(self, requests, ordered=True):
+        # pymongo keeps the operation's arguments in private attributes
+        result = BulkResult()
+        with self._lock:
+            for request in requests:
+                name = type(request).__name__
+                if name == "ReplaceOne":
+                    document = dict(request._doc)
+                    existing = [key for key, d in self.documents.items() if self.matches(d, request._filter)]
+                    if existing:
+                        document.setdefault("_id", existing[0])
+                        result.modified_count += 1
+                    else:
+                        result.upserted_count += 1
+                    self.documents[document["_id"]] = document
+                elif name == "DeleteMany":
+                    stale = [key for key, d in self.documents.items() if self.matches(d, request._filter)]
+                    for key in stale:
+                        del self.documents[key]
+                    result.deleted_count += len(stale)
+                else:
+                    raise NotImplementedError(name)
+        return result
+
+    def __len__(self):
+        return len(self.documents)
+
+
+class BulkResult:
+    def __init__(self):
+        self.upserted_count = self.modified_count = self.deleted_count = 0
+
+
+class InMemoryDatabase:
+    def __init__(self):
+        self.collections = {}
+
+    def __getitem__(self, name):
+        return self.collections.setdefault(name, InMemoryCollection())
+
+
+class InMemoryMongoClient:
+    def __init__(self):
+        self.databases = {}
+
+    def __getitem__(self, name):
+        return self.databases.setdefault(name, InMemoryDatabase())
+
+
+def _pdf_string(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+def write_sample_pdf(path, pages, lines_per_page=40, seed=0):
+    """Write a text-only PDF resume with `pages` pages of Helvetica text."""
+    rng = random.Random(seed)
+    words = ("Python engineer built scalable data pipelines services APIs with Flask MongoDB "
+             "Selenium Gemini embeddings vector search distributed systems led team of five").split()
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for page in range(pages):
+        lines = [" ".join(rng.choice(words) for _ in range(12)) for _ in range(lines_per_page)]
+        commands = ["BT", "/F1 10 Tf", "14 TL", "50 760 Td", f"(Page {page + 1}) Tj"]
+        commands += [f"T* ({_pdf_string(line)}) Tj" for line in lines]
+        stream = "\n".join(commands + ["ET"])
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append("<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    output = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    output += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode("latin-1")
+    output += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+    with open(path, "wb") as f:
+        f.write(output)
@@ -0,0 +1,194 @@
+import os
+import json
+import queue
+import threading
+from functools import lru_cache
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from dotenv import load_dotenv
+import config
+from metrics import span
+from atomic_files import save_json
+
+# Load environment variables
+load_dotenv()
+
+# Paths LinkedIn redirects to when the session is not authenticated
+LOGGED_OUT_PATHS = ('/login', '/authwall', '/checkpoint', '/uas/login')
+
+@lru_cache(maxsize=None)
+def get_chromedriver_path():
+    # Resolve (and download if needed) chromedriver once per process
+    return ChromeDriverManager().install()
+
+def create_driver():
+    # Set up Selenium WebDriver options
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--disable-gpu')
+    # Return from driver.get() once the DOM is ready; content is awaited explicitly
+    chrome_options.page_load_strategy = 'eager'
+
+    # Initialize Chrome WebDriver using the cached chromedriver
+    service = Service(get_chromedriver_path())
+    return webdriver.Chrome(service=service, options=chrome_options)
+
+def login(driver, login_url=None, timeout=None):
+    login_url = login_url or config.LINKEDIN_LOGIN_URL
+    driver.get(login_url)
+    wait = WebDriverWait(driver, timeout or config.LINKEDIN_LOGIN_TIMEOUT)
+    wait.until(EC.presence_of_element_located((By.ID, 'username'))).send_keys(os.getenv('LINKEDIN_EMAIL'))
+    driver.find_element(By.ID, 'password').send_keys(os.getenv('LINKEDIN_PASSWORD'))
+    driver.find_element(By.CSS_SELECTOR, '.login__form_action_container button').click()
+
+    # Wait for login to complete: the browser leaves the login page
+    wait.until(lambda d: d.current_url.rstrip('/') != login_url.rstrip('/'))
+
+def load_cookies(path):
+    try:
+        with open(path, 'r') as f:
+            cookies = json.load(f)
+        return cookies if isinstance(cookies, list) else []
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+
+
+class BrowserPool:
+    """Warm, logged-in Chrome drivers shared by scrape jobs.
+
+    Drivers are created on demand up to `size` and handed out with
+    `with pool.driver() as driver:`. A new driver is authenticated with the
+    session cookies saved in `cookie_path` and only goes through the login
+    form when those are missing or expired, so scraping N profiles costs one
+    login at most. Drivers are health-checked before reuse, replaced when a
+    job fails with them, and recycled after `max_uses` jobs.
+    """
+
+    def __init__(self, size=None, cookie_path=None, login_url=None, max_uses=None):
+        self.size = size or config.LINKEDIN_POOL_SIZE
+        self.cookie_path = cookie_path if cookie_path is not None else config.LINKEDIN_COOKIE_PATH
+        self.login_url = login_url or config.LINKEDIN_LOGIN_URL
+        self.max_uses = max_uses or config.LINKEDIN_DRIVER_MAX_USES
+        parts = urlsplit(self.login_url)
+        self.base_url = f"{parts.scheme}://{parts.netloc}/"
+
+        self._idle = queue.LifoQueue()  # Most recently used first, it is the warmest
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._uses = {}
+        self._lock = threading.Lock()  # Guards _uses, _closed and returns to _idle
+        self._auth_lock = threading.Lock()
+        self._cookies = load_cookies(self.cookie_path) if self.cookie_path else []
+        self._closed = False
+
+    def _is_logged_in(self, driver):
+        driver.get(self.base_url + 'feed/')
+        path = urlsplit(driver.current_url).path
+        login_path = urlsplit(self.login_url).path.rstrip('/')
+        return not path.startswith(LOGGED_OUT_PATHS) and (not login_path or not path.startswith(login_path))
+
+    def _apply_cookies(self, driver):
+        # Cookies can only be set for the domain currently loaded
+        driver.get(self.base_url)
+        for cookie in self._cookies:
+            try:
+                driver.add_cookie(cookie)
+            except Exception:
+                pass  # Skip cookies the browser rejects (e.g. for another subdomain)
+
+    def _authenticate(self, driver):
+        with self._auth_lock:
+            if self._cookies:
+                self._apply_cookies(driver)
+                if self._is_logged_in(driver):
+                    return
+            with span("linkedin.login"):
+                login(driver, self.login_url)
+            self._cookies = driver.get_cookies()
+            if self.cookie_path:
+                save_json(self.cookie_path, self._cookies)
+
+    @staticmethod
+    def _is_healthy(driver):
+        try:
+            return driver.execute_script("return 1") == 1 and len(driver.window_handles) > 0
+        except Exception:
+            return False
+
+    def _discard(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _checkout(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if self._is_healthy(driver):
+                return driver
+            self._discard(driver)
+
+        driver = create_driver()
+        try:
+            self._authenticate(driver)
+        except Exception:
+            self._discard(driver)
+            raise
+        with self._lock:
+            self._uses[id(driver)] = 0
+        return driver
+
+    def _checkin(self, driver):
+        # Counted and returned under the lock, so close() cannot miss a
+        # driver that is being handed back at the same time
+        with self._lock:
+            self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+            retire = self._closed or self._uses[id(driver)] >= self.max_uses
+            if not retire:
+                self._idle.put(driver)
+        if retire:
+            self._discard(driver)
+
+    @contextmanager
+    def driver(self):
+        if self._closed:
+            raise RuntimeError("BrowserPool is closed")
+        self._slots.acquire()
+        try:
+            driver = self._checkout()
+            try:
+                yield driver
+            except BaseException:
+                # The job may have left the browser in a bad state
+                self._discard(driver)
+                raise
+            else:
+                self._checkin(driver)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,88 @@
+import json
+import hashlib
+
+# List fields that are split into one chunk per entry, by source
+ITEM_SECTIONS = {
+    "resume": ["work_experience", "projects", "certifications"],
+    "linkedin": ["work_experience", "education", "certifications", "honors_and_awards"],
+    "github": ["repositories"],
+}
+
+# Fields that identify an item, so its chunk_id survives reordering
+ITEM_KEYS = {
+    "repositories": "name",
+}
+
+def count_tokens(text: str) -> int:
+    # Simple token estimation, same as the one used for the chat context
+    return len(text.split())
+
+def split_to_budget(text: str, max_tokens: int) -> list:
+    # Items over the budget are cut into consecutive word windows
+    words = text.split()
+    if len(words) <= max_tokens:
+        return [text]
+    return [" ".join(words[start:start + max_tokens]) for start in range(0, len(words), max_tokens)]
+
+def render_chunk(text: str) -> str:
+    # Prompt-ready form of a stored chunk: pretty-printed JSON, or the text
+    # itself for plain-text parts of oversized items
+    try:
+        return json.dumps(json.loads(text), indent=2)
+    except json.JSONDecodeError:
+        return text
+
+def content_version(text: str) -> str:
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+def item_key(section: str, item_index: int, item) -> str:
+    key_field = ITEM_KEYS.get(section)
+    if key_field and isinstance(item, dict) and item.get(key_field):
+        return str(item[key_field])
+    return str(item_index)
+
+def make_chunks(source: str, section: str, item_index: int, payload, max_tokens: int) -> list:
+    text = payload if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False)
+    pieces = split_to_budget(text, max_tokens)
+    key = item_key(section, item_index, payload)
+    return [{
+        "chunk_id": f"{source}:{section}:{key}:{part}",
+        "source": source,
+        "section": section,
+        "item_index": item_index,
+        "part": part,
+        "parts": len(pieces),
+        "token_count": count_tokens(piece),
+        "content_version": content_version(piece),
+        "rendered": render_chunk(piece),
+        "text": piece,
+    } for part, piece in enumerate(pieces)]
+
+def chunk_source(source: str, data: dict, max_tokens: int) -> list:
+    """Split one formatted source into per-item chunks.
+
+    Entries of the list fields in ITEM_SECTIONS become one chunk each;
+    everything else (name, headline, skills, ...) is kept together in a
+    single "profile" chunk for the source.
+    """
+    if not isinstance(data, dict):
+        return make_chunks(source, "profile", 0, data, max_tokens) if data else []
+
+    chunks = []
+    profile = {}
+    for field, value in data.items():
+        if field in ITEM_SECTIONS.get(source, []) and isinstance(value, list):
+            for item_index, item in enumerate(value):
+                chunks.extend(make_chunks(source, field, item_index, item, max_tokens))
+        else:
+            profile[field] = value
+
+    if profile:
+        chunks = make_chunks(source, "profile", 0, profile, max_tokens) + chunks
+    return chunks
+
+def chunk_profile(final_data: dict, max_tokens: int = 256) -> list:
+    chunks = []
+    for source in ITEM_SECTIONS:
+        chunks.extend(chunk_source(source, final_data.get(source) or {}, max_tokens))
+    return chunks
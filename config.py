@@ -0,0 +1,113 @@
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Gemini quota: starting requests per minute shared by every generate_content
+# call; the limiter adapts it between the min and max from 429/503 responses
+GEMINI_REQUESTS_PER_MINUTE = float(os.getenv('GEMINI_REQUESTS_PER_MINUTE', '15'))
+GEMINI_MIN_REQUESTS_PER_MINUTE = float(os.getenv('GEMINI_MIN_REQUESTS_PER_MINUTE', '2'))
+GEMINI_MAX_REQUESTS_PER_MINUTE = float(os.getenv('GEMINI_MAX_REQUESTS_PER_MINUTE', '60'))
+# Number of requests that may be issued back to back before pacing kicks in
+GEMINI_BURST = int(os.getenv('GEMINI_BURST', '3'))
+# Same for embed_content, which has its own quota
+GEMINI_EMBED_REQUESTS_PER_MINUTE = float(os.getenv('GEMINI_EMBED_REQUESTS_PER_MINUTE', '100'))
+GEMINI_EMBED_MAX_REQUESTS_PER_MINUTE = float(os.getenv('GEMINI_EMBED_MAX_REQUESTS_PER_MINUTE', '1500'))
+# AIMD: requests per minute added after each success, factor applied on a 429/503
+GEMINI_RATE_INCREASE = float(os.getenv('GEMINI_RATE_INCREASE', '0.5'))
+GEMINI_RATE_DECREASE = float(os.getenv('GEMINI_RATE_DECREASE', '0.5'))
+# Retries of a throttled or failed Gemini call, with jittered exponential backoff (seconds)
+GEMINI_MAX_RETRIES = int(os.getenv('GEMINI_MAX_RETRIES', '5'))
+GEMINI_RETRY_BASE_DELAY = float(os.getenv('GEMINI_RETRY_BASE_DELAY', '1'))
+GEMINI_RETRY_MAX_DELAY = float(os.getenv('GEMINI_RETRY_MAX_DELAY', '32'))
+# Chat requests retry less and give up (503) once waiting for the quota
+# would take longer than this many seconds
+GEMINI_CHAT_MAX_RETRIES = int(os.getenv('GEMINI_CHAT_MAX_RETRIES', '2'))
+GEMINI_CHAT_DEADLINE = float(os.getenv('GEMINI_CHAT_DEADLINE', '5'))
+# SQLite file holding the limiter state shared by every process on the host;
+# set it to an empty value to keep the state per process
+GEMINI_LIMITER_PATH = os.getenv('GEMINI_LIMITER_PATH', os.path.join('.cache', 'gemini_limiter.sqlite3'))
+
+# GitHub API base URL (overridable to point at a mirror or a local replay server)
+GITHUB_API_URL = os.getenv('GITHUB_API_URL', 'https://api.github.com').rstrip('/')
+# Maximum number of README downloads in flight at once
+GITHUB_README_WORKERS = int(os.getenv('GITHUB_README_WORKERS', '8'))
+
+# On-disk embedding cache; set EMBEDDING_CACHE_PATH to an empty value to disable it
+EMBEDDING_CACHE_PATH = os.getenv('EMBEDDING_CACHE_PATH', os.path.join('.cache', 'embeddings.sqlite3'))
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv('EMBEDDING_CACHE_MAX_ENTRIES', '10000'))
+# Inputs per batchEmbedContents request (the API accepts at most 100)
+EMBEDDING_BATCH_SIZE = min(100, int(os.getenv('EMBEDDING_BATCH_SIZE', '100')))
+
+# On-disk cache of Gemini formatting responses, keyed by model, generation
+# config and prompt; set LLM_CACHE_ENABLED=false to always call Gemini
+LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'true').lower() not in ('0', 'false', 'no', 'off')
+LLM_CACHE_PATH = os.getenv('LLM_CACHE_PATH', os.path.join('.cache', 'llm_responses.sqlite3'))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', '2000'))
+
+# Token budget per stored chunk (whitespace-token estimate)
+CHUNK_MAX_TOKENS = int(os.getenv('CHUNK_MAX_TOKENS', '256'))
+# Number of chunks retrieved per context-specific chat message
+RETRIEVAL_TOP_K = int(os.getenv('RETRIEVAL_TOP_K', '5'))
+
+# Vector search backend for /chat: "atlas" ($vectorSearch) or "numpy" (in-process index)
+VECTOR_BACKEND = os.getenv('VECTOR_BACKEND', 'atlas').lower()
+# Snapshot written by main.py and loaded by the "numpy" backend (.json + .<generation>.npy)
+VECTOR_INDEX_PATH = os.getenv('VECTOR_INDEX_PATH', os.path.join('.cache', 'vector_index'))
+
+# Minimum confidence for the local message classifier before it asks Gemini instead
+CLASSIFIER_CONFIDENCE_THRESHOLD = float(os.getenv('CLASSIFIER_CONFIDENCE_THRESHOLD', '0.75'))
+
+# Semantic /chat response cache: minimum cosine similarity, TTL (seconds) and size
+RESPONSE_CACHE_THRESHOLD = float(os.getenv('RESPONSE_CACHE_THRESHOLD', '0.95'))
+RESPONSE_CACHE_TTL = float(os.getenv('RESPONSE_CACHE_TTL', '3600'))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '256'))
+# How often (seconds) the chat service checks whether the profile was re-ingested
+PROFILE_VERSION_CHECK_INTERVAL = float(os.getenv('PROFILE_VERSION_CHECK_INTERVAL', '60'))
+
+# Chat history store: "memory" (per process) or "sqlite" (shared file at CONVERSATION_DB_PATH)
+CONVERSATION_BACKEND = os.getenv('CONVERSATION_BACKEND', 'memory').lower()
+CONVERSATION_DB_PATH = os.getenv('CONVERSATION_DB_PATH', os.path.join('.cache', 'conversations.sqlite3'))
+# Turns kept per conversation, and seconds of inactivity before a conversation expires
+CONVERSATION_MAX_TURNS = int(os.getenv('CONVERSATION_MAX_TURNS', '20'))
+CONVERSATION_TTL = float(os.getenv('CONVERSATION_TTL', '86400'))
+
+# LinkedIn scraping: login page, and how long to wait for page content (seconds)
+LINKEDIN_LOGIN_URL = os.getenv('LINKEDIN_LOGIN_URL', 'https://www.linkedin.com/login')
+LINKEDIN_LOGIN_TIMEOUT = float(os.getenv('LINKEDIN_LOGIN_TIMEOUT', '20'))
+LINKEDIN_PAGE_TIMEOUT = float(os.getenv('LINKEDIN_PAGE_TIMEOUT', '15'))
+LINKEDIN_SECTION_TIMEOUT = float(os.getenv('LINKEDIN_SECTION_TIMEOUT', '10'))
+# Browser pool for LinkedIn scraping: drivers kept warm, uses before a driver is
+# recycled, and where session cookies are saved between runs
+LINKEDIN_POOL_SIZE = int(os.getenv('LINKEDIN_POOL_SIZE', '2'))
+LINKEDIN_DRIVER_MAX_USES = int(os.getenv('LINKEDIN_DRIVER_MAX_USES', '25'))
+LINKEDIN_COOKIE_PATH = os.getenv('LINKEDIN_COOKIE_PATH', os.path.join('.cache', 'linkedin_cookies.json'))
+
+# Fingerprints and formatted output of the last ingestion run, used to skip unchanged units
+INGEST_MANIFEST_PATH = os.getenv('INGEST_MANIFEST_PATH', os.path.join('.cache', 'ingest_manifest.json'))
+
+# Resume extraction: text backend ('pypdf2' or 'pdfminer'), worker processes
+# (0 = one per core), and the page count from which one PDF is split across them
+RESUME_PARSER_BACKEND = os.getenv('RESUME_PARSER_BACKEND', 'pypdf2').lower()
+RESUME_PARSER_WORKERS = int(os.getenv('RESUME_PARSER_WORKERS', '0')) or os.cpu_count() or 1
+RESUME_PARALLEL_MIN_PAGES = int(os.getenv('RESUME_PARALLEL_MIN_PAGES', '16'))
+
+# Batch ingestion (batch_ingest.py): per-profile checkpoints, and how many
+# profiles may be in each pipeline stage at once
+BATCH_CHECKPOINT_DIR = os.getenv('BATCH_CHECKPOINT_DIR', os.path.join('.cache', 'batch'))
+BATCH_SCRAPE_CONCURRENCY = int(os.getenv('BATCH_SCRAPE_CONCURRENCY', '2'))
+BATCH_FORMAT_CONCURRENCY = int(os.getenv('BATCH_FORMAT_CONCURRENCY', '3'))
+BATCH_EMBED_CONCURRENCY = int(os.getenv('BATCH_EMBED_CONCURRENCY', '2'))
+BATCH_STORE_CONCURRENCY = int(os.getenv('BATCH_STORE_CONCURRENCY', '1'))
+
+# Token budgets (about 4 characters each) for the data in a formatting prompt:
+# per item (e.g. one README) and for the whole prompt
+PROMPT_ITEM_MAX_TOKENS = int(os.getenv('PROMPT_ITEM_MAX_TOKENS', '500'))
+PROMPT_MAX_TOKENS = int(os.getenv('PROMPT_MAX_TOKENS', '20000'))
+
+# GitHub formatting is split into shards of this many repositories, formatted
+# by up to GITHUB_FORMAT_WORKERS concurrent prompts; a failed shard is retried
+GITHUB_FORMAT_SHARD_SIZE = int(os.getenv('GITHUB_FORMAT_SHARD_SIZE', '10'))
+GITHUB_FORMAT_WORKERS = int(os.getenv('GITHUB_FORMAT_WORKERS', '3'))
+GITHUB_FORMAT_RETRIES = int(os.getenv('GITHUB_FORMAT_RETRIES', '2'))
@@ -0,0 +1,158 @@
+import os
+import time
+import sqlite3
+import threading
+from collections import deque, namedtuple
+
+Turn = namedtuple("Turn", ["text", "tokens"])
+
+def make_turn(message: str, response: str) -> Turn:
+    text = f"User: {message}\nBot: {response}"
+    return Turn(text, len(text.split()))  # Simple token estimation, computed once per turn
+
+
+class MemoryBackend:
+    """Per-process store: one bounded deque of turns per conversation."""
+
+    def __init__(self, max_turns: int, ttl: float) -> None:
+        self.max_turns = max_turns
+        self.ttl = ttl
+        self._conversations = {}  # id -> (deque of turns, last_seen)
+        self._last_sweep = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _sweep(self, now: float) -> None:
+        # Drop idle conversations, at most once a minute
+        if now - self._last_sweep < 60:
+            return
+        self._last_sweep = now
+        expired = [cid for cid, (_, seen) in self._conversations.items() if now - seen > self.ttl]
+        for cid in expired:
+            del self._conversations[cid]
+
+    def load(self, conversation_id: str) -> list:
+        now = time.monotonic()
+        with self._lock:
+            self._sweep(now)
+            entry = self._conversations.get(conversation_id)
+            if entry is None or now - entry[1] > self.ttl:
+                return []
+            return list(entry[0])
+
+    def append(self, conversation_id: str, turn: Turn) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._sweep(now)
+            entry = self._conversations.get(conversation_id)
+            if entry is None or now - entry[1] > self.ttl:
+                turns = deque(maxlen=self.max_turns)
+            else:
+                turns = entry[0]
+            turns.append(turn)
+            self._conversations[conversation_id] = (turns, now)
+
+
+class SQLiteBackend:
+    """Store shared by every worker on the host; keeps the last max_turns rows per conversation."""
+
+    def __init__(self, path: str, max_turns: int, ttl: float) -> None:
+        self.max_turns = max_turns
+        self.ttl = ttl
+        self._last_sweep = 0.0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS turns ("
+            "conversation_id TEXT NOT NULL, seq INTEGER NOT NULL, text TEXT NOT NULL, "
+            "tokens INTEGER NOT NULL, created_at REAL NOT NULL, PRIMARY KEY (conversation_id, seq))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS turns_created_at ON turns (created_at)")
+
+    def _sweep(self, now: float) -> None:
+        if now - self._last_sweep < 60:
+            return
+        self._last_sweep = now
+        # Remove conversations whose newest turn is older than the TTL
+        self._conn.execute(
+            "DELETE FROM turns WHERE conversation_id IN "
+            "(SELECT conversation_id FROM turns GROUP BY conversation_id HAVING MAX(created_at) < ?)",
+            (now - self.ttl,),
+        )
+
+    def load(self, conversation_id: str) -> list:
+        now = time.time()
+        with self._lock:
+            self._sweep(now)
+            rows = self._conn.execute(
+                "SELECT text, tokens, created_at FROM turns WHERE conversation_id = ? "
+                "ORDER BY seq DESC LIMIT ?",
+                (conversation_id, self.max_turns),
+            ).fetchall()
+        if not rows or now - rows[0][2] > self.ttl:
+            return []
+        return [Turn(text, tokens) for text, tokens, _ in reversed(rows)]
+
+    def append(self, conversation_id: str, turn: Turn) -> None:
+        now = time.time()
+        with self._lock:
+            self._sweep(now)
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                seq = self._conn.execute(
+                    "SELECT COALESCE(MAX(seq), 0) + 1 FROM turns WHERE conversation_id = ?",
+                    (conversation_id,),
+                ).fetchone()[0]
+                self._conn.execute(
+                    "INSERT INTO turns (conversation_id, seq, text, tokens, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (conversation_id, seq, turn.text, turn.tokens, now),
+                )
+                self._conn.execute(
+                    "DELETE FROM turns WHERE conversation_id = ? AND seq <= ?",
+                    (conversation_id, seq - self.max_turns),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+
+class ConversationStore:
+    """Bounded, turn-structured chat history.
+
+    Only the last `max_turns` turns of a conversation are kept, each with
+    its token count computed when it is saved, so building the context costs
+    O(turns kept) regardless of how long the conversation has run.
+    """
+
+    def __init__(self, backend) -> None:
+        self.backend = backend
+
+    def save_turn(self, conversation_id: str, message: str, response: str) -> None:
+        self.backend.append(conversation_id, make_turn(message, response))
+
+    def get_context(self, conversation_id: str, max_tokens: int = 1000) -> str:
+        if not conversation_id:
+            return ""
+        selected = []
+        budget = max_tokens
+        for turn in reversed(self.backend.load(conversation_id)):
+            if turn.tokens > budget:
+                if not selected:
+                    # The newest turn alone is over budget: keep its tail
+                    selected.append(" ".join(turn.text.split()[-max_tokens:]))
+                break
+            selected.append(turn.text)
+            budget -= turn.tokens
+        return "\n".join(reversed(selected))
+
+def create_conversation_store(backend: str, path: str, max_turns: int, ttl: float) -> ConversationStore:
+    if backend == "sqlite":
+        return ConversationStore(SQLiteBackend(path, max_turns, ttl))
+    if backend == "memory":
+        return ConversationStore(MemoryBackend(max_turns, ttl))
+    raise ValueError(f"Unknown conversation backend: {backend}")
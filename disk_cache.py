@@ -0,0 +1,122 @@
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+
+
+def make_cache_key(*parts) -> str:
+    """Content-addressed key: SHA-256 over the parts, NUL separated."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """Size-bounded LRU key/value store backed by SQLite.
+
+    SQLite's file locking makes the cache safe to share between processes
+    (e.g. two ingestion runs at once); a lock serialises threads within a
+    process. Hit/miss counters are kept per instance.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+
+    def get(self, key: str):
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+            return row[0]
+
+    def get_many(self, keys: list) -> dict:
+        """Look up several keys at once; returns only the keys that were found."""
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), 500):  # Stay under SQLite's parameter limit
+                batch = keys[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM entries WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                found.update(rows)
+            now = time.time()
+            self._conn.executemany("UPDATE entries SET last_access = ? WHERE key = ?",
+                                   [(now, key) for key in found])
+            self.hits += len(found)
+            self.misses += len(set(keys) - found.keys())
+        return found
+
+    def set(self, key: str, value: bytes) -> None:
+        self.set_many({key: value})
+
+    def set_many(self, items: dict) -> None:
+        if not items:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO entries (key, value, last_access) VALUES (?, ?, ?)",
+                    [(key, sqlite3.Binary(value), now) for key, value in items.items()],
+                )
+                self._evict()
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _evict(self) -> None:
+        # Drop the least recently used entries beyond max_entries
+        count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM entries WHERE key IN "
+                "(SELECT key FROM entries ORDER BY last_access ASC LIMIT ?)",
+                (excess,),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,34 @@
+import json
+import hashlib
+from atomic_files import save_json
+
+# Fingerprints of the raw inputs of an ingestion run, saved together with the
+# formatted output they produced. The next run reuses that output for every
+# unit whose fingerprint has not changed.
+
+def text_fingerprint(text) -> str:
+    if not isinstance(text, str):
+        text = json.dumps(text, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def file_fingerprint(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def repo_fingerprint(repo: dict) -> str:
+    return text_fingerprint([repo.get('updated_at'), text_fingerprint(repo.get('readme') or '')])
+
+def load_manifest(path: str) -> dict:
+    try:
+        with open(path, 'r') as f:
+            manifest = json.load(f)
+        return manifest if isinstance(manifest, dict) else {}
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_manifest(path: str, manifest: dict) -> None:
+    # Renamed into place, so an interrupted run never leaves a partial manifest
+    save_json(path, manifest)
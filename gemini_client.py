@@ -0,0 +1,223 @@
+import os
+import json
+import threading
+import numpy as np
+from dotenv import load_dotenv
+from disk_cache import DiskCache, make_cache_key
+from metrics import span, increment
+from rate_limiter import AdaptiveRateLimiter, call_with_retry
+import config
+
+# Gemini clients shared by the chat service and the ingestion pipeline. This
+# module must stay light to import: app.py loads it on every cold start.
+
+# Load environment variables
+load_dotenv()
+
+# Set up Gemini API key
+GEMINI_API_KEY = os.getenv('GOOGLE_API_KEY')
+
+_gemini_configured = False
+_generative_models = {}
+_lock = threading.Lock()
+
+def get_genai():
+    # google.generativeai takes most of a cold start to import, so it is only
+    # loaded once a request actually needs Gemini (cache hits never do)
+    import google.generativeai as genai
+    return genai
+
+def configure_gemini() -> bool:
+    # Configure the client once per process instead of on every call
+    global _gemini_configured
+    if not GEMINI_API_KEY:
+        return False
+    if not _gemini_configured:
+        with _lock:
+            if not _gemini_configured:
+                get_genai().configure(api_key=GEMINI_API_KEY)
+                _gemini_configured = True
+    return True
+
+def get_generative_model(model_name: str = 'gemini-1.5-flash'):
+    # Reused across requests; created on first use
+    model = _generative_models.get(model_name)
+    if model is None:
+        configure_gemini()
+        model = _generative_models.setdefault(model_name, get_genai().GenerativeModel(model_name))
+    return model
+
+_embedding_cache = None
+
+def get_embedding_cache():
+    # One cache per process, opened on first use; None when disabled or unavailable
+    global _embedding_cache
+    if _embedding_cache is None and config.EMBEDDING_CACHE_PATH:
+        with _lock:
+            if _embedding_cache is None and config.EMBEDDING_CACHE_PATH:
+                try:
+                    _embedding_cache = DiskCache(config.EMBEDDING_CACHE_PATH, config.EMBEDDING_CACHE_MAX_ENTRIES)
+                except Exception as e:
+                    print(f"Embedding cache disabled: {e}")
+                    config.EMBEDDING_CACHE_PATH = ""
+    return _embedding_cache
+
+_llm_cache = None
+
+def get_llm_cache():
+    # Same life cycle as the embedding cache; None when disabled or unavailable
+    global _llm_cache
+    if _llm_cache is None and config.LLM_CACHE_ENABLED and config.LLM_CACHE_PATH:
+        with _lock:
+            if _llm_cache is None and config.LLM_CACHE_ENABLED and config.LLM_CACHE_PATH:
+                try:
+                    _llm_cache = DiskCache(config.LLM_CACHE_PATH, config.LLM_CACHE_MAX_ENTRIES)
+                except Exception as e:
+                    print(f"LLM response cache disabled: {e}")
+                    config.LLM_CACHE_ENABLED = False
+    return _llm_cache
+
+_limiters = {}
+
+def get_gemini_limiter(kind: str = "generate"):
+    # One adaptive limiter per quota ("generate" or "embed"), created on first
+    # use; processes sharing GEMINI_LIMITER_PATH share its budget and rate
+    limiter = _limiters.get(kind)
+    if limiter is None:
+        with _lock:
+            limiter = _limiters.get(kind)
+            if limiter is None:
+                if kind == "embed":
+                    rpm, max_rpm = config.GEMINI_EMBED_REQUESTS_PER_MINUTE, config.GEMINI_EMBED_MAX_REQUESTS_PER_MINUTE
+                else:
+                    rpm, max_rpm = config.GEMINI_REQUESTS_PER_MINUTE, config.GEMINI_MAX_REQUESTS_PER_MINUTE
+                settings = dict(burst=config.GEMINI_BURST, min_rpm=config.GEMINI_MIN_REQUESTS_PER_MINUTE,
+                                max_rpm=max_rpm, increase=config.GEMINI_RATE_INCREASE,
+                                decrease=config.GEMINI_RATE_DECREASE)
+                try:
+                    limiter = AdaptiveRateLimiter(kind, rpm, path=config.GEMINI_LIMITER_PATH or None, **settings)
+                except Exception as e:
+                    print(f"Shared Gemini limiter unavailable, pacing this process only: {e}")
+                    limiter = AdaptiveRateLimiter(kind, rpm, **settings)
+                _limiters[kind] = limiter
+    return limiter
+
+def call_gemini(function, kind: str = "generate", limiter=None, interactive: bool = False):
+    """Result of `function()`, paced by the shared Gemini limiter.
+
+    429/503 responses slow the limiter down and are retried with jittered
+    backoff, as are 500/504; rate_limiter.RateLimitExceeded is raised once
+    GEMINI_MAX_RETRIES retries are used up. Interactive (chat) calls retry
+    GEMINI_CHAT_MAX_RETRIES times and give up as soon as waiting would take
+    longer than GEMINI_CHAT_DEADLINE seconds.
+    """
+    if interactive:
+        retries, deadline = config.GEMINI_CHAT_MAX_RETRIES, config.GEMINI_CHAT_DEADLINE
+    else:
+        retries, deadline = config.GEMINI_MAX_RETRIES, None
+    return call_with_retry(function, limiter or get_gemini_limiter(kind), retries=retries, deadline=deadline,
+                           base_delay=config.GEMINI_RETRY_BASE_DELAY, max_delay=config.GEMINI_RETRY_MAX_DELAY)
+
+def generate_content_cached(model_name: str, prompt: str, generation_config: dict = None,
+                            parse=None, limiter=None, use_cache: bool = True):
+    """Text of a generate_content call, parsed with `parse` if given.
+
+    A byte-identical request (same model, generation config and prompt) is
+    answered from the LLM response cache without calling Gemini. Responses
+    are only cached once `parse` accepted them, so a malformed answer is
+    asked for again on the next run; `parse` should therefore check the shape
+    the caller needs, not just the syntax. A cached answer that `parse`
+    rejects is treated as a miss. API calls go through call_gemini();
+    `limiter` replaces the shared "generate" limiter.
+    """
+    cache = get_llm_cache() if use_cache else None
+    key = make_cache_key("generate_content", model_name, json.dumps(generation_config or {}, sort_keys=True), prompt)
+    if cache is not None:
+        cached = cache.get(key)
+        lookup = "miss"
+        if cached is not None:
+            text = bytes(cached).decode("utf-8")
+            try:
+                parsed = parse(text) if parse else text
+                lookup = "hit"
+            except Exception:
+                # Stored before `parse` became stricter; asked again and replaced
+                lookup = "invalid"
+        increment("llm_cache_requests_total", result=lookup)
+        if lookup == "hit":
+            return parsed
+
+    configure_gemini()
+    model = get_genai().GenerativeModel(model_name, generation_config=generation_config)
+    with span("gemini.generate_content"):
+        text = call_gemini(lambda: model.generate_content(prompt).text, limiter=limiter)
+    result = parse(text) if parse else text
+    if cache is not None:
+        cache.set(key, text.encode("utf-8"))
+    return result
+
+class GoogleEmbeddings:
+    def __init__(self, model_name: str = "models/embedding-001",
+                 task_type: str = "retrieval_document", use_cache: bool = True,
+                 batch_size: int = config.EMBEDDING_BATCH_SIZE, interactive: bool = False) -> None:
+        self.model_name = model_name
+        self.interactive = interactive  # Chat requests: see call_gemini()
+        self.task_type = task_type
+        self.batch_size = batch_size
+        self.use_cache = use_cache
+
+    @property
+    def cache(self):
+        # Opened on first use so that importing or constructing this is free
+        return get_embedding_cache() if self.use_cache else None
+
+    def generate_embeddings(self, inp: str) -> list:
+        embeddings = self.generate_embeddings_batch([inp])
+        if not len(embeddings):
+            return []
+        return embeddings[0].tolist()
+
+    def generate_embeddings_batch(self, texts) -> np.ndarray:
+        """Embed many texts, returning a contiguous float32 matrix with one row per text.
+
+        Cached vectors are reused; the rest are sent to the API in requests of
+        up to `batch_size` inputs. Returns an empty matrix on failure.
+        """
+        texts = list(texts)
+        empty = np.empty((0, 0), dtype=np.float32)
+        if not texts:
+            return empty
+
+        keys = [make_cache_key(self.model_name, self.task_type, text) for text in texts]
+        vectors = {}
+        if self.cache is not None:
+            for key, value in self.cache.get_many(list(set(keys))).items():
+                vectors[key] = np.frombuffer(value, dtype=np.float32)
+
+        # Identical texts share a key, so each distinct text is embedded once
+        pending = list({key: text for key, text in zip(keys, texts) if key not in vectors}.items())
+        if pending:
+            if not configure_gemini():
+                print("Please set correct Google API key")
+                return empty
+
+            fresh = {}
+            for start in range(0, len(pending), self.batch_size):
+                batch = pending[start:start + self.batch_size]
+                with span("gemini.embed_content"):
+                    result = call_gemini(lambda: get_genai().embed_content(model=self.model_name,
+                                            content=[text for _, text in batch],
+                                            task_type=self.task_type,), kind="embed",
+                                         interactive=self.interactive)
+                embeddings = result.get("embedding", [])
+                if len(embeddings) != len(batch):
+                    print("Embeddings not found")
+                    return empty
+                for (key, _), embedding in zip(batch, embeddings):
+                    fresh[key] = np.asarray(embedding, dtype=np.float32)
+
+            if self.cache is not None:
+                self.cache.set_many({key: vector.tobytes() for key, vector in fresh.items()})
+            vectors.update(fresh)
+
+        return np.ascontiguousarray(np.stack([vectors[key] for key in keys]), dtype=np.float32)
@@ -1,25 +1,57 @@
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 import base64
 import os
+import config
+from metrics import span
 
-def fetch_github_repositories(username):
-    headers = {
-        "Authorization": f"token {os.getenv('GITHUB_ACCESS_TOKEN')}"
-    }
-    url = f'https://api.github.com/users/{username}/repos'
+def create_github_session(pool_size=config.GITHUB_README_WORKERS):
+    session = requests.Session()
+    session.headers.update({
+        "Authorization": f"token {os.getenv('GITHUB_ACCESS_TOKEN')}",
+        "Accept": "application/vnd.github+json"
+    })
+    # Keep one pooled connection per README worker so requests reuse sockets
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def fetch_all_pages(session, url, params=None):
+    # Follow the Link: rel="next" header until GitHub stops returning one
+    items = []
+    while url:
+        response = session.get(url, params=params)
+        response.raise_for_status()
+        items.extend(response.json())
+        url = response.links.get('next', {}).get('url')
+        params = None  # The next URL already carries the query string
+    return items
+
+def fetch_readme(session, username, repo_name):
+    readme_url = f'{config.GITHUB_API_URL}/repos/{username}/{repo_name}/readme'
+    response = session.get(readme_url)
+    if response.status_code == 404:
+        return ""  # Repository has no README
+    response.raise_for_status()
+    return base64.b64decode(response.json()['content']).decode('utf-8', errors='replace')
+
+def fetch_github_repositories(username, max_workers=config.GITHUB_README_WORKERS):
+    # Returns None when the fetch fails, so that callers can tell a failed
+    # fetch (rate limit, network error) from an account without repositories
+    url = f'{config.GITHUB_API_URL}/users/{username}/repos'
+    session = create_github_session(max_workers)
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()  # Raises HTTPError for bad responses
-        repos = response.json()
+        with span("github.list_repos"):
+            repos = fetch_all_pages(session, url, params={"per_page": 100})
 
-        repo_data = []
-        for repo in repos:
-            readme_url = f'https://api.github.com/repos/{username}/{repo["name"]}/readme'
-            readme_response = requests.get(readme_url, headers=headers)
-            readme_response.raise_for_status()
+        # Fetch READMEs concurrently; map() keeps the original repo order
+        with span("github.readmes"), ThreadPoolExecutor(max_workers=max_workers) as executor:
+            readmes = list(executor.map(lambda repo: fetch_readme(session, username, repo['name']), repos))
 
-            readme_content = base64.b64decode(readme_response.json()['content']).decode('utf-8')
-            
+        repo_data = []
+        for repo, readme_content in zip(repos, readmes):
             data = {
                 "name": repo['name'],
                 "description": repo.get('description', 'No description provided'),
@@ -30,14 +62,16 @@ def fetch_github_repositories(username):
                 "updated_at": repo['updated_at']
             }
             repo_data.append(data)
-        
+
         return repo_data
 
     except requests.exceptions.HTTPError as err:
         print(f"HTTP error occurred: {err}")  # Print the complete error
-        print(f"Response status code: {response.status_code}")
-        print(f"Response content: {response.content}")
+        print(f"Response status code: {err.response.status_code}")
+        print(f"Response content: {err.response.content}")
     except Exception as err:
         print(f"Other error occurred: {err}")
+    finally:
+        session.close()
 
-    return []
+    return None
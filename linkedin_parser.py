@@ -0,0 +1,45 @@
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Parsing of LinkedIn page HTML. Kept free of Selenium so it can run on
+# saved pages, e.g. the fixtures in benchmarks/fixtures/linkedin.
+
+CARD_CLASS = 'artdeco-card'
+
+# Elements whose text a browser would not show (LinkedIn repeats most labels
+# in a visually-hidden span for screen readers)
+HIDDEN_SELECTOR = 'script, style, noscript, template, .visually-hidden'
+
+try:
+    import lxml  # noqa: F401
+    PARSER = 'lxml'
+except ImportError:
+    PARSER = 'html.parser'
+
+def has_card_class(value) -> bool:
+    # While parsing, the class attribute may still be the raw string
+    if not value:
+        return False
+    classes = value.split() if isinstance(value, str) else value
+    return CARD_CLASS in classes
+
+def element_text(element) -> str:
+    for hidden in element.select(HIDDEN_SELECTOR):
+        hidden.decompose()
+    return element.get_text("\n", strip=True)
+
+def extract_card_texts(html: str) -> list:
+    """Text of every artdeco-card on the page, in document order."""
+    # Only card subtrees are built, which keeps parsing cheap on large pages
+    soup = BeautifulSoup(html, PARSER, parse_only=SoupStrainer(class_=has_card_class))
+    return [element_text(card) for card in soup.find_all(class_=CARD_CLASS)]
+
+def extract_section_text(html: str) -> str:
+    return "\n".join(extract_card_texts(html))
+
+def extract_page_text(html: str) -> str:
+    soup = BeautifulSoup(html, PARSER)
+    return element_text(soup.body or soup)
+
+def extract_section_text_from_file(path: str) -> str:
+    with open(path, 'r', encoding='utf-8') as f:
+        return extract_section_text(f.read())
@@ -1,72 +1,121 @@
-import json
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.common.by import By
 import time
+from concurrent.futures import ThreadPoolExecutor
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from dotenv import load_dotenv
-import os
-
-def scrape_linkedin_profile(linkedin_url):
-    # Set up Selenium WebDriver options
-    chrome_options = Options()
-    chrome_options.add_argument('--headless')
-    chrome_options.add_argument('--disable-gpu')
-
-    # Initialize Chrome WebDriver using ChromeDriverManager and Service
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-
-    # Log in to LinkedIn using credentials from .env
-    driver.get('https://www.linkedin.com/login')
-    driver.find_element(By.ID, 'username').send_keys(os.getenv('LINKEDIN_EMAIL'))
-    driver.find_element(By.ID, 'password').send_keys(os.getenv('LINKEDIN_PASSWORD'))
-    driver.find_element(By.CSS_SELECTOR, '.login__form_action_container button').click()
-
-    # Wait for login to complete
-    time.sleep(5)
+import config
+from browser_pool import BrowserPool
+from linkedin_parser import extract_section_text, extract_page_text
+from metrics import span
 
-    # Load existing JSON data from final_data.json
-    profile_data = {}
-    try:
-        with open('final_data.json', 'r') as json_file:
-            profile_data = json.load(json_file)
-            if not isinstance(profile_data, dict):
-                profile_data = {}
-    except FileNotFoundError:
-        profile_data = {}
-
-    # Scrape data from the main profile page
-    driver.get(linkedin_url)
-    time.sleep(5)  # Wait for the page to load completely
+# Load environment variables
+load_dotenv()
 
-    main_page_data = driver.find_element(By.TAG_NAME, 'body').text
-    profile_data['Main Profile'] = main_page_data
+CARD_LOCATOR = (By.CLASS_NAME, 'artdeco-card')
 
-    # Define sections to scrape
-    sections = {
+def get_section_urls(linkedin_url):
+    return {
         "Licenses and Certifications": linkedin_url + 'details/certifications/',
         "Skills": linkedin_url + 'details/skills/',
         "Recommendations": linkedin_url + 'details/recommendations/?detailScreenTabIndex=0',
         "Honors and Awards": linkedin_url + 'details/honors/'
     }
 
-    # Scrape each section, focusing on 'artdeco-card' class content
-    for section_name, section_url in sections.items():
-        driver.get(section_url)
-        time.sleep(5)  # Wait for the page to load completely
+def wait_for_cards(driver, timeout):
+    # Return as soon as an artdeco-card is on the page; a section without
+    # cards (or a slow one) gives up after `timeout` instead of failing
+    try:
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located(CARD_LOCATOR))
+        return True
+    except TimeoutException:
+        return False
 
-        artdeco_cards = driver.find_elements(By.CLASS_NAME, 'artdeco-card')
-        section_content = "\n".join([card.text.strip() for card in artdeco_cards])
+def read_cards(driver):
+    # One page_source round trip, parsed locally, instead of a WebDriver
+    # call per card
+    html = driver.page_source
+    with span("linkedin.parse"):
+        return extract_section_text(html)
 
-        profile_data[section_name] = section_content
+def scrape_sections(driver, sections, timeout=None):
+    """Load every section in its own tab at once, then read each tab.
 
-    # Close the browser
-    driver.quit()
+    The browser fetches and renders all tabs concurrently, so the total wait
+    is roughly that of the slowest section. Each section gets `timeout`
+    seconds from when it was opened; one that shows no cards by then comes
+    back empty.
+    """
+    timeout = timeout or config.LINKEDIN_SECTION_TIMEOUT
+    main_window = driver.current_window_handle
 
-    # Save the updated data into final_data.json
-    with open('final_data.json', 'w') as json_file:
-        json.dump(profile_data, json_file, indent=4)
+    tabs = {}
+    for section_name, section_url in sections.items():
+        before = set(driver.window_handles)
+        driver.execute_script("window.open(arguments[0], '_blank');", section_url)
+        new_handles = set(driver.window_handles) - before
+        tabs[section_name] = (new_handles.pop() if new_handles else None, time.monotonic())
 
+    section_data = {}
+    for section_name, (handle, opened_at) in tabs.items():
+        if handle is None:
+            section_data[section_name] = ""
+            continue
+        driver.switch_to.window(handle)
+        remaining = max(0.0, timeout - (time.monotonic() - opened_at))
+        wait_for_cards(driver, remaining)
+        section_data[section_name] = read_cards(driver)
+        driver.close()
+
+    driver.switch_to.window(main_window)
+    return section_data
+
+def scrape_profile(driver, linkedin_url):
+    # Scrape data from the main profile page
+    with span("linkedin.main_page"):
+        driver.get(linkedin_url)
+        wait_for_cards(driver, config.LINKEDIN_PAGE_TIMEOUT)
+        html = driver.page_source
+    with span("linkedin.parse"):
+        profile_data = {'Main Profile': extract_page_text(html)}
+
+    # Scrape the detail sections in parallel tabs, focusing on 'artdeco-card' class content
+    with span("linkedin.sections"):
+        profile_data.update(scrape_sections(driver, get_section_urls(linkedin_url)))
     return profile_data
+
+def scrape_linkedin_profiles(linkedin_urls, pool=None):
+    """Scrape several profiles concurrently on a shared pool of logged-in browsers.
+
+    Returns {linkedin_url: profile_data}; a profile that fails maps to {}.
+    """
+    own_pool = pool is None
+    pool = pool or BrowserPool()
+
+    def scrape(linkedin_url):
+        try:
+            with pool.driver() as driver:
+                return scrape_profile(driver, linkedin_url)
+        except Exception as e:
+            print(f"Failed to scrape {linkedin_url}: {e}")
+            return {}
+
+    try:
+        with ThreadPoolExecutor(max_workers=pool.size) as executor:
+            return dict(zip(linkedin_urls, executor.map(scrape, linkedin_urls)))
+    finally:
+        if own_pool:
+            pool.close()
+
+def scrape_linkedin_profile(linkedin_url, login_url=None, pool=None):
+    # Without a pool, use a single-browser one for this call; it still reuses
+    # the saved session cookies instead of logging in every time
+    own_pool = pool is None
+    pool = pool or BrowserPool(size=1, login_url=login_url)
+    try:
+        with pool.driver() as driver:
+            return scrape_profile(driver, linkedin_url)
+    finally:
+        if own_pool:
+            pool.close()
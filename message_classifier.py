@@ -0,0 +1,139 @@
+import re
+import threading
+from collections import Counter, namedtuple
+import numpy as np
+
+CASUAL = "casual"
+CONTEXT_SPECIFIC = "context-specific"
+
+# Small talk that never needs the profile
+CASUAL_PATTERNS = [
+    r"^\s*(hi+|hello+|hey+|yo|hiya|howdy|greetings|sup)\b",
+    r"\bgood (morning|afternoon|evening|night)\b",
+    r"\bhow are (you|u)\b|\bhow'?s it going\b|\bwhat'?s up\b",
+    r"^\s*(thanks|thank you|thx|ty|cheers|cool|nice|great|awesome|ok(ay)?|bye|goodbye|see (you|ya))\b[\s!.]*$",
+    r"\b(tell me a joke|nice to meet you)\b",
+]
+
+# Questions about the profile owner's background
+CONTEXT_PATTERNS = [
+    r"\b(skills?|experience|work(s|ed|ing)?|jobs?|roles?|company|companies|employer|intern(ship)?s?)\b",
+    r"\b(projects?|repos?|repositor(y|ies)|github|linkedin|resume|cv|portfolio)\b",
+    r"\b(educat\w*|degree|universit(y|ies)|college|school|stud(y|ied|ying)|major|gpa)\b",
+    r"\b(certif\w*|awards?|honou?rs?|achievements?|publications?)\b",
+    r"\b(languages?|frameworks?|tech(nolog(y|ies))?|stack|tools?|python|java(script)?|react|sql|machine learning|ml|ai)\b",
+    r"\b(contact|email|hire|hiring|available|availability|location|based)\b",
+]
+
+# Seed phrases whose embeddings form the nearest-centroid fallback
+CASUAL_EXAMPLES = [
+    "hello there",
+    "how are you doing today",
+    "thanks a lot",
+    "tell me a joke",
+    "what's the weather like",
+    "goodbye, have a nice day",
+]
+CONTEXT_EXAMPLES = [
+    "what are your skills",
+    "where have you worked before",
+    "tell me about your projects",
+    "what did you study at university",
+    "which programming languages do you know",
+    "do you have any certifications",
+]
+
+Classification = namedtuple("Classification", ["label", "confidence", "method", "embedding"])
+
+
+class MessageClassifier:
+    """Decides 'casual' vs 'context-specific' locally, asking the LLM only when unsure.
+
+    Order of checks: keyword/regex rules, then nearest-centroid matching of
+    the message embedding against the seed examples, then `llm_classify`
+    when the centroid confidence is below `threshold`. `embed_batch` takes
+    a list of texts and returns a float matrix; the message embedding it
+    produces is returned so callers can reuse it for retrieval.
+    """
+
+    def __init__(self, embed_batch, llm_classify, threshold: float = 0.75, temperature: float = 0.02) -> None:
+        self.embed_batch = embed_batch
+        self.llm_classify = llm_classify
+        self.threshold = threshold
+        self.temperature = temperature
+        self.counts = Counter()
+        self._counts_lock = threading.Lock()  # Classified from concurrent request threads
+        self._centroids = None
+        self._lock = threading.Lock()
+        self._casual = [re.compile(p, re.IGNORECASE) for p in CASUAL_PATTERNS]
+        self._context = [re.compile(p, re.IGNORECASE) for p in CONTEXT_PATTERNS]
+
+    def classify_with_rules(self, message: str):
+        casual = any(p.search(message) for p in self._casual)
+        context = any(p.search(message) for p in self._context)
+        if context and not casual:
+            return CONTEXT_SPECIFIC
+        if casual and not context:
+            return CASUAL
+        return None  # No rule matched, or both did
+
+    def centroids(self):
+        # Embedded once per process (and served from the embedding cache after that)
+        with self._lock:
+            if self._centroids is None:
+                vectors = self.embed_batch(CASUAL_EXAMPLES + CONTEXT_EXAMPLES)
+                if not len(vectors):
+                    return None
+                vectors = np.asarray(vectors, dtype=np.float32)
+                vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+                casual = vectors[:len(CASUAL_EXAMPLES)].mean(axis=0)
+                context = vectors[len(CASUAL_EXAMPLES):].mean(axis=0)
+                self._centroids = np.stack([casual / np.linalg.norm(casual), context / np.linalg.norm(context)])
+            return self._centroids
+
+    def classify_with_centroids(self, embedding):
+        centroids = self.centroids()
+        if centroids is None or not len(embedding):
+            return None, 0.0
+        vector = np.asarray(embedding, dtype=np.float32)
+        casual_sim, context_sim = centroids @ (vector / np.linalg.norm(vector))
+        # Logistic over the similarity margin; cosine gaps between the two
+        # centroids are small, hence the low temperature
+        p_context = 1.0 / (1.0 + np.exp(-(context_sim - casual_sim) / self.temperature))
+        if p_context >= 0.5:
+            return CONTEXT_SPECIFIC, float(p_context)
+        return CASUAL, float(1.0 - p_context)
+
+    def classify(self, message: str, embedding=None) -> Classification:
+        label = self.classify_with_rules(message)
+        if label is not None:
+            self._count("rules")
+            return Classification(label, 1.0, "rules", embedding)
+
+        if embedding is None:
+            embeddings = self.embed_batch([message])
+            embedding = embeddings[0] if len(embeddings) else []
+
+        label, confidence = self.classify_with_centroids(embedding)
+        if label is not None and confidence >= self.threshold:
+            self._count("centroid")
+            return Classification(label, confidence, "centroid", embedding)
+
+        self._count("llm")
+        return Classification(self.llm_classify(message), confidence, "llm", embedding)
+
+    def _count(self, method: str) -> None:
+        with self._counts_lock:
+            self.counts[method] += 1
+
+    def stats(self) -> dict:
+        with self._counts_lock:
+            counts = Counter(self.counts)
+        total = sum(counts.values())
+        return {
+            "rules": counts["rules"],
+            "centroid": counts["centroid"],
+            "llm": counts["llm"],
+            "total": total,
+            "remote_fallback_rate": counts["llm"] / total if total else 0.0,
+        }
@@ -0,0 +1,149 @@
+import time
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# In-process timing spans, histograms and counters. The chat service exposes
+# them in the Prometheus text format on /metrics; ingestion runs print them
+# as a summary table. Every process keeps its own values.
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+METRIC_PREFIX = "pde"
+
+
+class Histogram:
+    def __init__(self, buckets=LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # The last one is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        # Upper bound of the bucket holding the q-th observation
+        if not self.count:
+            return 0.0
+        rank, seen = q * self.count, 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._spans = {}     # span name -> Histogram
+        self._errors = {}    # span name -> failed span count
+        self._counters = {}  # (name, labels) -> value
+
+    def observe(self, span: str, seconds: float, failed: bool = False) -> None:
+        with self._lock:
+            histogram = self._spans.get(span)
+            if histogram is None:
+                histogram = self._spans[span] = Histogram()
+            histogram.observe(seconds)
+            if failed:
+                self._errors[span] = self._errors.get(span, 0) + 1
+
+    def increment(self, name: str, value: float = 1, **labels) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    @contextmanager
+    def span(self, name: str):
+        """Time the block as span `name`; a block that raises counts as an error."""
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self.observe(name, time.perf_counter() - start, failed)
+
+    def timed(self, name: str):
+        # Decorator form of span()
+        def decorate(function):
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return function(*args, **kwargs)
+            wrapper.__name__ = function.__name__
+            wrapper.__doc__ = function.__doc__
+            return wrapper
+        return decorate
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self._errors.clear()
+            self._counters.clear()
+
+    def render_prometheus(self) -> str:
+        lines = []
+        with self._lock:
+            spans = sorted(self._spans.items())
+            errors = dict(self._errors)
+            counters = sorted(self._counters.items())
+
+        name = f"{METRIC_PREFIX}_span_duration_seconds"
+        lines += [f"# HELP {name} Duration of timed spans.", f"# TYPE {name} histogram"]
+        for span, histogram in spans:
+            label = f'span="{escape_label(span)}"'
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{label},le="+Inf"}} {histogram.count}')
+            lines.append(f"{name}_sum{{{label}}} {histogram.sum}")
+            lines.append(f"{name}_count{{{label}}} {histogram.count}")
+
+        name = f"{METRIC_PREFIX}_span_errors_total"
+        lines += [f"# HELP {name} Spans that ended with an exception.", f"# TYPE {name} counter"]
+        for span, _ in spans:
+            lines.append(f'{name}{{span="{escape_label(span)}"}} {errors.get(span, 0)}')
+
+        declared = set()
+        for (counter, labels), value in counters:
+            name = f"{METRIC_PREFIX}_{counter}"
+            if name not in declared:
+                lines.append(f"# TYPE {name} counter")
+                declared.add(name)
+            label_text = ",".join(f'{key}="{escape_label(str(val))}"' for key, val in labels)
+            lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+    def summary_table(self) -> str:
+        with self._lock:
+            rows = [(span, histogram.count, histogram.sum, histogram.quantile(0.5), histogram.quantile(0.95),
+                     histogram.max, self._errors.get(span, 0)) for span, histogram in self._spans.items()]
+        if not rows:
+            return "No spans recorded"
+        rows.sort(key=lambda row: row[2], reverse=True)
+        width = max(len("span"), *(len(row[0]) for row in rows))
+        lines = [f"{'span':<{width}}  {'count':>6}  {'total s':>9}  {'p50 s':>7}  {'p95 s':>7}  {'max s':>8}  {'errors':>6}"]
+        for span, count, total, p50, p95, longest, failed in rows:
+            lines.append(f"{span:<{width}}  {count:>6}  {total:>9.3f}  {p50:>7.3f}  {p95:>7.3f}  {longest:>8.3f}  {failed:>6}")
+        return "\n".join(lines)
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+# Shared by every module in the process
+registry = MetricsRegistry()
+span = registry.span
+timed = registry.timed
+increment = registry.increment
@@ -0,0 +1,159 @@
+import re
+import json
+import html
+import threading
+import config
+from metrics import timed
+
+# Pre-processing of the data sent to the format_*_with_gemini prompts: strips
+# markdown/HTML noise, serializes compactly and trims every prompt to a token
+# budget, so the cost of a formatting call follows the useful content rather
+# than the raw README or page size.
+
+# Rough size of a Gemini token for English text and code
+CHARS_PER_TOKEN = 4
+
+TRUNCATION_MARK = " …"
+
+# Applied in order; each pattern is replaced by its replacement
+MARKDOWN_NOISE = [
+    (re.compile(r'<!--.*?-->', re.S), ''),
+    (re.compile(r'^\s*(```|~~~)\s*([\w+-]*)[^\n]*\n.*?^\s*\1[^\n]*$', re.S | re.M),
+     lambda m: f"({m.group(2)} code)" if m.group(2) else ''),
+    (re.compile(r'\[!\[[^\]]*\]\([^)]*\)\]\([^)]*\)'), ''),       # Linked images (badges)
+    (re.compile(r'!\[[^\]]*\]\([^)]*\)'), ''),                    # Images
+    (re.compile(r'<(script|style)\b.*?</\1>', re.S | re.I), ''),
+    (re.compile(r'<[^>\n]+>'), ''),                               # HTML tags, keeping their text
+    (re.compile(r'\[([^\]]+)\]\([^)]*\)'), r'\1'),                # Links, keeping their text
+    (re.compile(r'^\s*\[[^\]]+\]:\s*\S+.*$', re.M), ''),          # Reference-style link targets
+    (re.compile(r'https?://\S+'), ''),
+    (re.compile(r'^\s*\|?(\s*:?-{3,}:?\s*\|)+\s*:?-*:?\s*\|?\s*$', re.M), ''),  # Table separator rows
+    (re.compile(r'^\s*([-*_]\s*){3,}$', re.M), ''),               # Horizontal rules
+    (re.compile(r'^\s{0,3}#{1,6}\s*', re.M), ''),                 # Heading markers
+    (re.compile(r'(\*\*|__|`)'), ''),
+]
+
+_savings = {"raw_tokens": 0, "compact_tokens": 0}
+_savings_lock = threading.Lock()
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+def compact_json(data) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+def compact_text(text: str) -> str:
+    # Trim every line, drop blank and repeated lines (LinkedIn repeats most
+    # labels), and collapse runs of spaces
+    lines, previous = [], None
+    for line in text.splitlines():
+        line = re.sub(r'[ \t ]+', ' ', line).strip()
+        if line and line != previous:
+            lines.append(line)
+        previous = line or previous
+    return "\n".join(lines)
+
+def strip_markdown(text: str) -> str:
+    for pattern, replacement in MARKDOWN_NOISE:
+        text = pattern.sub(replacement, text)
+    return compact_text(html.unescape(text))
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    limit = max(0, max_tokens) * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    if limit <= len(TRUNCATION_MARK):
+        return ""
+    cut = text[:limit - len(TRUNCATION_MARK)]
+    # Prefer ending on a line or sentence boundary when one is close enough
+    boundary = max(cut.rfind("\n"), cut.rfind(". "))
+    if boundary >= len(cut) // 2:
+        cut = cut[:boundary + 1]
+    return cut.rstrip() + TRUNCATION_MARK
+
+def encoded_tokens(text: str) -> int:
+    # Size once embedded as a JSON string, where newlines and quotes are escaped
+    return estimate_tokens(compact_json(text)[1:-1])
+
+def truncate_encoded(text: str, max_tokens: int) -> str:
+    # truncate_to_tokens() for a budget counted in encoded tokens: shrink the
+    # raw budget in proportion to the overshoot until the encoded text fits
+    limit = max_tokens
+    while True:
+        truncated = truncate_to_tokens(text, limit)
+        size = encoded_tokens(truncated)
+        if size <= max_tokens or limit <= 0:
+            return truncated
+        limit = min(limit - 1, limit * max_tokens // size)
+
+def fit_budgets(sizes: list, total: int) -> list:
+    """Per-item caps so that sum(min(size, cap)) <= total.
+
+    Small items keep their full size and the largest ones are trimmed to an
+    equal share of what is left.
+    """
+    if sum(sizes) <= total:
+        return list(sizes)
+    remaining, count = max(0, total), len(sizes)
+    for size in sorted(sizes):
+        share = remaining // count
+        if size > share:
+            return [min(size, share) for size in sizes]
+        remaining -= size
+        count -= 1
+    return list(sizes)
+
+def record_savings(label: str, raw_data, payload: str) -> str:
+    # Compared with the indent=4 JSON the prompts used to embed
+    raw_text = raw_data if isinstance(raw_data, str) else json.dumps(raw_data, indent=4)
+    raw_tokens, compact_tokens = estimate_tokens(raw_text), estimate_tokens(payload)
+    with _savings_lock:
+        _savings["raw_tokens"] += raw_tokens
+        _savings["compact_tokens"] += compact_tokens
+    print(f"{label} prompt data: ~{raw_tokens} -> ~{compact_tokens} tokens (~{raw_tokens - compact_tokens} saved)")
+    return payload
+
+def get_savings() -> dict:
+    with _savings_lock:
+        return {**_savings, "saved_tokens": _savings["raw_tokens"] - _savings["compact_tokens"]}
+
+@timed("prompt.compact_resume")
+def compact_resume(resume_text: str, max_tokens: int = None) -> str:
+    max_tokens = max_tokens or config.PROMPT_MAX_TOKENS
+    payload = truncate_to_tokens(compact_text(resume_text or ""), max_tokens)
+    return record_savings("Resume", resume_text or "", payload)
+
+@timed("prompt.compact_linkedin")
+def compact_linkedin(linkedin_data: dict, max_tokens: int = None) -> str:
+    # Sections share the prompt budget; the longest ones are trimmed first
+    max_tokens = max_tokens or config.PROMPT_MAX_TOKENS
+    # Sections are page text; anything else is serialized rather than rejected
+    sections = {name: compact_text(text if isinstance(text, str) else compact_json(text) if text else "")
+                for name, text in linkedin_data.items()}
+    sections = {name: text for name, text in sections.items() if text}
+    overhead = estimate_tokens(compact_json({name: "" for name in sections}))
+    caps = fit_budgets([encoded_tokens(text) for text in sections.values()], max_tokens - overhead)
+    payload = compact_json({name: truncate_encoded(text, cap) for (name, text), cap in zip(sections.items(), caps)})
+    return record_savings("LinkedIn", linkedin_data, payload)
+
+@timed("prompt.compact_github")
+def compact_github(github_data: list, item_tokens: int = None, max_tokens: int = None) -> str:
+    """Repositories without URLs or empty fields, with cleaned READMEs.
+
+    Each README is cut to `item_tokens`; when all of them together still
+    exceed the prompt budget, the longest are trimmed further.
+    """
+    item_tokens = item_tokens or config.PROMPT_ITEM_MAX_TOKENS
+    max_tokens = max_tokens or config.PROMPT_MAX_TOKENS
+    repos, readmes = [], []
+    for repo in github_data:
+        repos.append({key: repo[key] for key in ('name', 'description', 'created_at', 'updated_at') if repo.get(key)})
+        readmes.append(truncate_encoded(strip_markdown(repo.get('readme') or ""), item_tokens))
+
+    overhead = estimate_tokens(compact_json(repos)) + len(repos) * estimate_tokens(',"readme":""')
+    caps = fit_budgets([encoded_tokens(readme) for readme in readmes], max_tokens - overhead)
+    for repo, readme, cap in zip(repos, readmes, caps):
+        readme = truncate_encoded(readme, cap)
+        if readme:
+            repo['readme'] = readme
+    return record_savings("GitHub", github_data, compact_json(repos))
@@ -0,0 +1,202 @@
+import os
+import time
+import random
+import sqlite3
+import threading
+
+
+# HTTP statuses worth retrying, and the subset that means "slow down"
+RETRYABLE_STATUSES = {429, 500, 503, 504}
+THROTTLE_STATUSES = {429, 503}
+
+
+class RateLimitExceeded(Exception):
+    """A call was still throttled after its retries, or would wait past its deadline."""
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AdaptiveRateLimiter:
+    """Token bucket whose rate adapts to the service's answers (AIMD).
+
+    Every success adds `increase` requests per minute, up to `max_rpm`. A
+    throttled call (429/503) multiplies the rate by `decrease`, down to
+    `min_rpm`, at most once per `cooldown` seconds so a wave of concurrent
+    429s counts as one signal. It also empties the bucket.
+
+    The bucket lives in a SQLite row, so every process that opens the same
+    `path` draws from one shared budget and learns the same rate; path=None
+    keeps it in memory for this process only. `name` selects the bucket, so
+    one file can hold several quotas.
+    """
+
+    def __init__(self, name: str, requests_per_minute: float, burst: int = 1, min_rpm: float = 1.0,
+                 max_rpm: float = None, increase: float = 0.5, decrease: float = 0.5,
+                 cooldown: float = 2.0, path: str = None) -> None:
+        self.name = name
+        self.initial_rpm = requests_per_minute
+        self.capacity = max(1, burst)
+        self.min_rpm = min_rpm
+        self.max_rpm = max_rpm or requests_per_minute
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path or ":memory:", timeout=30, isolation_level=None, check_same_thread=False)
+        if path:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            "name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL, "
+            "rate REAL NOT NULL, last_decrease REAL NOT NULL)"
+        )
+
+    def _update(self, change):
+        # Read-modify-write of the bucket in one write transaction, so
+        # concurrent processes never hand out the same token twice
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = self._conn.execute(
+                    "SELECT tokens, updated_at, rate, last_decrease FROM buckets WHERE name = ?", (self.name,)
+                ).fetchone()
+                if row is None:
+                    row = (float(self.capacity), now, self.initial_rpm, 0.0)
+                tokens, updated_at, rate, last_decrease = row
+                rate = min(self.max_rpm, max(self.min_rpm, rate))
+                tokens = min(self.capacity, tokens + max(0.0, now - updated_at) * rate / 60.0)
+                tokens, rate, last_decrease, result = change(now, tokens, rate, last_decrease)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO buckets (name, tokens, updated_at, rate, last_decrease) VALUES (?, ?, ?, ?, ?)",
+                    (self.name, tokens, now, rate, last_decrease),
+                )
+                self._conn.execute("COMMIT")
+                return result
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    @property
+    def requests_per_minute(self) -> float:
+        return self._update(lambda now, tokens, rate, last: (tokens, rate, last, rate))
+
+    def acquire(self, max_wait: float = None) -> float:
+        """Wait for a token; returns the seconds spent waiting.
+
+        With `max_wait`, a caller that would have to wait longer than that
+        takes no token and gets RateLimitExceeded at once.
+        """
+        def reserve(now, tokens, rate, last_decrease):
+            # Reserve a token (possibly going negative) and sleep off the debt
+            # outside the transaction so other callers can queue up behind us
+            wait = (1 - tokens) * 60.0 / rate if tokens < 1 else 0.0
+            if max_wait is not None and wait > max_wait:
+                return tokens, rate, last_decrease, (False, wait)
+            return tokens - 1, rate, last_decrease, (True, wait)
+
+        reserved, wait = self._update(reserve)
+        if not reserved:
+            raise RateLimitExceeded(f"Gemini {self.name} quota needs a {wait:.1f}s wait", wait)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def on_success(self) -> None:
+        self._update(lambda now, tokens, rate, last: (tokens, min(self.max_rpm, rate + self.increase), last, None))
+
+    def on_throttle(self) -> None:
+        def back_off(now, tokens, rate, last_decrease):
+            if now - last_decrease < self.cooldown:
+                return tokens, rate, last_decrease, None
+            return min(tokens, 0.0), max(self.min_rpm, rate * self.decrease), now, None
+
+        self._update(back_off)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# gRPC status names and the HTTP status they correspond to
+GRPC_STATUSES = {"RESOURCE_EXHAUSTED": 429, "INTERNAL": 500, "UNAVAILABLE": 503, "DEADLINE_EXCEEDED": 504}
+
+def error_status(error):
+    """HTTP status of an API error, or None if it does not carry one.
+
+    Only structured statuses are trusted: the `code` of google.api_core
+    exceptions, a gRPC status code, or the status of an HTTP response.
+    Numbers in the error message are ignored.
+    """
+    code = getattr(error, "code", None)
+    if callable(code):
+        # grpc.RpcError exposes its status through a method
+        try:
+            code = code()
+        except Exception:
+            code = None
+    for status in (code, getattr(error, "grpc_status_code", None)):
+        name = getattr(status, "name", None)
+        if name in GRPC_STATUSES:
+            return GRPC_STATUSES[name]
+    if isinstance(code, int):
+        return int(code)
+    response_status = getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(response_status, int):
+        return response_status
+    return None
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    # "Full jitter": a random delay up to the exponential cap, so clients that
+    # were throttled together do not retry together
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+def call_with_retry(function, limiter=None, retries: int = 5, base_delay: float = 1.0, max_delay: float = 32.0,
+                    deadline: float = None):
+    """Call `function()` under `limiter`, retrying throttled and transient errors.
+
+    Each attempt takes a token from the limiter first. Successes and 429/503
+    responses are reported to it so it can adapt its rate. Other errors are
+    raised at once. When a throttled call still fails after `retries`
+    retries, RateLimitExceeded is raised.
+
+    `deadline` bounds, in seconds, the time spent waiting for tokens and
+    backing off. Once a wait would go past it, the call gives up at once
+    (RateLimitExceeded for throttling) instead of waiting.
+    """
+    start = time.monotonic()
+
+    def remaining():
+        return None if deadline is None else deadline - (time.monotonic() - start)
+
+    for attempt in range(retries + 1):
+        if limiter is not None:
+            limiter.acquire(max_wait=remaining())
+        try:
+            result = function()
+        except Exception as e:
+            status = error_status(e)
+            if status not in RETRYABLE_STATUSES:
+                raise
+            if status in THROTTLE_STATUSES and limiter is not None:
+                limiter.on_throttle()
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            left = remaining()
+            if attempt == retries or (left is not None and delay > left):
+                if status in THROTTLE_STATUSES:
+                    retry_after = min(max_delay, base_delay * (2 ** (attempt + 1)))
+                    raise RateLimitExceeded(f"Still throttled after {attempt} retries: {e}", retry_after) from e
+                raise
+            print(f"Gemini call failed with {status}, retrying in {delay:.1f}s: {e}")
+            time.sleep(delay)
+        else:
+            if limiter is not None:
+                limiter.on_success()
+            return result
@@ -0,0 +1,87 @@
+import time
+import threading
+from collections import OrderedDict
+import numpy as np
+
+
+class SemanticResponseCache:
+    """In-memory cache of chat answers keyed by query embedding.
+
+    A lookup hits when the cosine similarity between the query and a cached
+    query is at least `threshold`. Entries expire after `ttl` seconds and
+    the least recently used entry is evicted beyond `max_entries`. Entries
+    are tagged with the profile version they were answered from; a new
+    version (set after re-ingestion) drops everything.
+    """
+
+    def __init__(self, threshold: float = 0.95, ttl: float = 3600, max_entries: int = 256) -> None:
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.profile_version = None
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (normalised embedding, answer, created_at)
+        self._next_key = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(embedding) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _expire(self, now: float) -> None:
+        expired = [key for key, (_, _, created) in self._entries.items() if now - created > self.ttl]
+        for key in expired:
+            del self._entries[key]
+
+    def set_profile_version(self, version) -> None:
+        with self._lock:
+            if version != self.profile_version:
+                self._entries.clear()
+                self.profile_version = version
+
+    def get(self, embedding):
+        if embedding is None or not len(embedding):
+            return None
+        with self._lock:
+            self._expire(time.time())
+            if not self._entries:
+                self.misses += 1
+                return None
+
+            keys = list(self._entries)
+            matrix = np.stack([self._entries[key][0] for key in keys])
+            similarities = matrix @ self._normalize(embedding)
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(keys[best])
+            return self._entries[keys[best]][1]
+
+    def put(self, embedding, answer: str) -> None:
+        if embedding is None or not len(embedding):
+            return
+        with self._lock:
+            self._entries[self._next_key] = (self._normalize(embedding), answer, time.time())
+            self._next_key += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "profile_version": self.profile_version,
+        }
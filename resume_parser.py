@@ -1,11 +1,145 @@
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+from collections import namedtuple
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 import PyPDF2
+import config
+
+# Text extraction backends. Workers run in separate processes, so everything
+# submitted to a pool is a top-level function (picklable on Windows too).
+BACKENDS = ('pypdf2', 'pdfminer')
+
+ResumeResult = namedtuple('ResumeResult', ['path', 'text', 'error'])
+
+def get_backend(backend=None):
+    backend = (backend or config.RESUME_PARSER_BACKEND).lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown resume parser backend {backend!r}, expected one of {', '.join(BACKENDS)}")
+    return backend
+
+def count_pages(pdf_path):
+    # PdfReader only reads the page tree here, not the page contents
+    with open(pdf_path, 'rb') as file:
+        return len(PyPDF2.PdfReader(file).pages)
+
+def extract_page_range(pdf_path, backend, start, stop):
+    """Text of pages [start, stop) of one PDF."""
+    if backend == 'pdfminer':
+        from pdfminer.high_level import extract_text
+        return extract_text(pdf_path, page_numbers=range(start, stop))
 
-def extract_resume_data(pdf_path):
     with open(pdf_path, 'rb') as file:
         reader = PyPDF2.PdfReader(file)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text()
-        
-        # Return the raw text, further processing could be added
-        return text
+        # Join once instead of growing a string page by page
+        return "".join(reader.pages[i].extract_text() or "" for i in range(start, stop))
+
+def split_pages(page_count, parts):
+    # Contiguous, nearly equal page ranges; joined in order they give the whole text
+    size, extra = divmod(page_count, parts)
+    ranges, start = [], 0
+    for i in range(parts):
+        stop = start + size + (1 if i < extra else 0)
+        if stop > start:
+            ranges.append((start, stop))
+        start = stop
+    return ranges
+
+def extract_resume_data(pdf_path, backend=None, max_workers=None):
+    """Raw text of a PDF resume.
+
+    Documents with at least RESUME_PARALLEL_MIN_PAGES pages are split into
+    page ranges that are extracted in parallel worker processes; shorter ones
+    are extracted in this process, where starting workers would cost more
+    than it saves.
+    """
+    backend = get_backend(backend)
+    workers = max_workers or config.RESUME_PARSER_WORKERS
+    page_count = count_pages(pdf_path)
+    if workers <= 1 or page_count < max(2, config.RESUME_PARALLEL_MIN_PAGES):
+        return extract_page_range(pdf_path, backend, 0, page_count)
+
+    ranges = split_pages(page_count, min(workers, page_count))
+    starts, stops = zip(*ranges)
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        return "".join(executor.map(extract_page_range, repeat(pdf_path), repeat(backend), starts, stops))
+
+def extract_resume_file(pdf_path, backend=None):
+    # Whole file in one worker; a failure is reported instead of ending the batch
+    try:
+        backend = get_backend(backend)
+        return ResumeResult(pdf_path, extract_page_range(pdf_path, backend, 0, count_pages(pdf_path)), None)
+    except Exception as e:
+        return ResumeResult(pdf_path, "", f"{type(e).__name__}: {e}")
+
+def find_resumes(source):
+    """PDF paths from a file, a directory (searched recursively), a glob, or a list of those."""
+    if isinstance(source, (list, tuple)):
+        return [path for item in source for path in find_resumes(item)]
+    if os.path.isdir(source):
+        paths = glob.glob(os.path.join(source, '**', '*'), recursive=True)
+        return sorted(path for path in paths if path.lower().endswith('.pdf') and os.path.isfile(path))
+    if glob.has_magic(source):
+        return sorted(glob.glob(source, recursive=True))
+    return [source]
+
+def extract_resumes(source, backend=None, max_workers=None):
+    """Yield a ResumeResult for every PDF in `source` as soon as it is done.
+
+    Files are spread over a process pool, one file per task, so results come
+    back in completion order rather than path order. Only a few tasks per
+    worker are in flight at a time, which keeps memory flat on large batches.
+    """
+    backend = get_backend(backend)
+    paths = find_resumes(source)
+    workers = min(max_workers or config.RESUME_PARSER_WORKERS, len(paths))
+    if workers <= 1:
+        for path in paths:
+            yield extract_resume_file(path, backend)
+        return
+
+    pending_paths = iter(paths)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = {executor.submit(extract_resume_file, path, backend) for path in _take(pending_paths, workers * 4)}
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+            in_flight |= {executor.submit(extract_resume_file, path, backend) for path in _take(pending_paths, len(done))}
+
+def _take(iterator, count):
+    return [path for _, path in zip(range(count), iterator)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract the text of PDF resumes to JSON lines.")
+    parser.add_argument("source", nargs="+", help="PDF files, directories or glob patterns")
+    parser.add_argument("--backend", choices=BACKENDS, help=f"text backend (default {config.RESUME_PARSER_BACKEND})")
+    parser.add_argument("--workers", type=int, help=f"worker processes (default {config.RESUME_PARSER_WORKERS})")
+    parser.add_argument("--output", help="JSONL file to write (default: stdout)")
+    args = parser.parse_args()
+
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    start = time.perf_counter()
+    count = failed = 0
+    try:
+        for result in extract_resumes(args.source, args.backend, args.workers):
+            count += 1
+            if result.error:
+                failed += 1
+                print(f"Failed to extract {result.path}: {result.error}", file=sys.stderr)
+            output.write(json.dumps(result._asdict(), ensure_ascii=False) + "\n")
+    finally:
+        if args.output:
+            output.close()
+
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed * 60 if elapsed else 0.0
+    print(f"Extracted {count - failed}/{count} resumes in {elapsed:.1f}s ({rate:.0f} per minute)", file=sys.stderr)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+import json
+import pytest
+import main
+
+
+def user_data():
+    return {"name": "Test User", "email": "test@example.com", "github_username": "test-user", "linkedin_url": ""}
+
+def github_unit(*names):
+    return {"repos": {name: {"fingerprint": name, "formatted": {"name": name, "description": f"{name} project"}}
+                      for name in names}}
+
+def final_data(unit):
+    empty = {"fingerprint": None, "formatted": {}}
+    return main.build_final_data(user_data(), empty, empty, unit)
+
+def test_diff_chunks_reports_changed_and_removed_chunks():
+    previous, _, _ = main.diff_chunks(final_data(github_unit("a", "b")), {})
+    current, changed, removed = main.diff_chunks(final_data(github_unit("a", "c")), previous)
+
+    assert any(chunk_id.startswith("github:repositories:c") for chunk_id in current)
+    assert {chunk["chunk_id"] for chunk in changed} == {chunk_id for chunk_id in current if chunk_id not in previous}
+    assert removed and all(chunk_id.startswith("github:repositories:b") for chunk_id in removed)
+
+def test_diff_chunks_without_changes():
+    previous, _, _ = main.diff_chunks(final_data(github_unit("a")), {})
+    assert main.diff_chunks(final_data(github_unit("a")), previous)[1:] == ([], [])
+
+def test_failed_github_fetch_keeps_the_previous_repositories(monkeypatch):
+    monkeypatch.setattr(main, "format_github_repos", lambda repos: pytest.fail("nothing should be formatted"))
+    previous = github_unit("a", "b")
+    unit = main.ingest_github(None, previous)
+    assert unit == previous
+
+    chunks, _, _ = main.diff_chunks(final_data(previous), {})
+    assert main.diff_chunks(final_data(unit), chunks)[2] == []
+
+def test_empty_account_removes_the_repositories(monkeypatch):
+    monkeypatch.setattr(main, "format_github_repos", lambda repos: [])
+    assert main.ingest_github([], github_unit("a")) == {"repos": {}}
+
+def test_align_formatted_repos_matches_by_name_then_fills_renamed_entries():
+    shard = [{"name": "a"}, {"name": "b"}, {"name": "c"}]
+    formatted = [{"name": "c"}, {"name": "B (renamed)"}, {"name": "a"}]
+    assert main.align_formatted_repos(shard, formatted) == [{"name": "a"}, {"name": "B (renamed)"}, {"name": "c"}]
+    assert main.align_formatted_repos(shard, None) == [None, None, None]
+
+def test_shard_is_asked_again_only_for_unusable_answers(monkeypatch):
+    calls = []
+    def fail(error):
+        def format_shard(shard):
+            calls.append(shard)
+            raise error
+        return format_shard
+
+    monkeypatch.setattr(main.config, "GITHUB_FORMAT_RETRIES", 2)
+    monkeypatch.setattr(main, "format_github_shard_with_gemini", fail(ValueError("not json")))
+    assert main.format_github_shard_with_retry([{"name": "a"}]) is None
+    assert len(calls) == 3
+
+    calls.clear()
+    monkeypatch.setattr(main, "format_github_shard_with_gemini", fail(RuntimeError("quota")))
+    assert main.format_github_shard_with_retry([{"name": "a"}]) is None
+    assert len(calls) == 1
+
+def test_parse_json_object_checks_the_shape():
+    assert main.parse_json_object('{"repositories": []}', {"repositories": list}) == {"repositories": []}
+    with pytest.raises(ValueError):
+        main.parse_json_object('[1, 2]')
+    with pytest.raises(ValueError):
+        main.parse_json_object('{"repos": []}', {"repositories": list})
+    with pytest.raises(json.JSONDecodeError):
+        main.parse_json_object('not json')
@@ -0,0 +1,37 @@
+import pytest
+from metrics import Histogram, MetricsRegistry
+
+
+def test_quantile_is_the_upper_bound_of_the_bucket():
+    histogram = Histogram(buckets=(0.1, 1.0, 10.0))
+    for value in (0.05, 0.05, 0.5, 5.0):
+        histogram.observe(value)
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1.0
+    assert histogram.quantile(1.0) == 5.0  # Capped at the largest observation
+
+def test_quantile_of_an_empty_histogram():
+    assert Histogram().quantile(0.95) == 0.0
+
+def test_quantile_above_the_last_bucket():
+    histogram = Histogram(buckets=(0.1,))
+    histogram.observe(42.0)
+    assert histogram.quantile(0.5) == 42.0
+
+def test_span_counts_errors():
+    registry = MetricsRegistry()
+    with registry.span("ok"):
+        pass
+    with pytest.raises(ValueError):
+        with registry.span("boom"):
+            raise ValueError()
+    text = registry.render_prometheus()
+    assert 'pde_span_duration_seconds_count{span="ok"} 1' in text
+    assert 'pde_span_errors_total{span="boom"} 1' in text
+    assert 'pde_span_errors_total{span="ok"} 0' in text
+
+def test_counters_and_label_escaping():
+    registry = MetricsRegistry()
+    registry.increment("requests_total", endpoint='a"b')
+    registry.increment("requests_total", endpoint='a"b')
+    assert 'pde_requests_total{endpoint="a\\"b"} 2' in registry.render_prometheus()
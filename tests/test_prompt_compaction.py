@@ -0,0 +1,44 @@
+import json
+from prompt_compaction import (CHARS_PER_TOKEN, TRUNCATION_MARK, compact_github, compact_linkedin,
+                               compact_text, estimate_tokens, fit_budgets, strip_markdown, truncate_to_tokens)
+
+
+def test_compact_text_drops_blank_and_repeated_lines():
+    assert compact_text("  Skills \n\nSkills\n  Python   and  SQL \n") == "Skills\nPython and SQL"
+
+def test_strip_markdown_removes_badges_links_and_code():
+    text = ("# Title\n[![Build](https://img.shields.io/b.svg)](https://ci)\n"
+            "See [the docs](https://example.com) for **details**.\n```bash\npip install x\n```\n")
+    assert strip_markdown(text) == "Title\nSee the docs for details.\n(bash code)"
+
+def test_truncate_to_tokens_respects_the_budget():
+    text = "word " * 200
+    truncated = truncate_to_tokens(text, 10)
+    assert len(truncated) <= 10 * CHARS_PER_TOKEN
+    assert truncated.endswith(TRUNCATION_MARK)
+    assert truncate_to_tokens("short", 10) == "short"
+
+def test_fit_budgets_trims_only_the_largest_items():
+    caps = fit_budgets([10, 500, 1000], 610)
+    assert caps[0] == 10
+    assert sum(min(size, cap) for size, cap in zip([10, 500, 1000], caps)) <= 610
+    assert fit_budgets([1, 2], 100) == [1, 2]
+
+def test_compact_linkedin_serializes_non_string_values():
+    payload = json.loads(compact_linkedin({"Main Profile": "Jane\n\nJane\nEngineer", "resume": {"skills": ["Python"]},
+                                           "github": None}))
+    assert payload["Main Profile"] == "Jane\nEngineer"
+    assert json.loads(payload["resume"]) == {"skills": ["Python"]}
+    assert "github" not in payload
+
+def test_compact_linkedin_fits_the_prompt_budget():
+    payload = compact_linkedin({"Experience": "line\n".join(str(i) for i in range(5000)), "Skills": "Python"},
+                               max_tokens=200)
+    assert estimate_tokens(payload) <= 200
+    assert json.loads(payload)["Skills"] == "Python"
+
+def test_compact_github_drops_urls_and_empty_fields():
+    repos = [{"name": "a", "description": None, "readme": "# A\nDoes things.", "html_url": "https://github.com/u/a",
+              "languages_url": "https://api.github.com/x", "created_at": "2023", "updated_at": "2024"}]
+    assert json.loads(compact_github(repos)) == [
+        {"name": "a", "created_at": "2023", "updated_at": "2024", "readme": "A\nDoes things."}]
@@ -0,0 +1,119 @@
+import time
+import pytest
+import rate_limiter
+from rate_limiter import AdaptiveRateLimiter, RateLimitExceeded, call_with_retry, error_status
+
+
+class ApiError(Exception):
+    def __init__(self, code, message="error"):
+        super().__init__(message)
+        self.code = code
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(rate_limiter.time, "sleep", lambda seconds: None)
+
+def tokens(limiter):
+    return limiter._update(lambda now, tokens, rate, last: (tokens, rate, last, tokens))
+
+def test_rate_increases_additively_and_decreases_multiplicatively():
+    limiter = AdaptiveRateLimiter("test", 60, min_rpm=10, max_rpm=61, increase=0.5, decrease=0.5, cooldown=0)
+    limiter.on_success()
+    assert limiter.requests_per_minute == 60.5
+    limiter.on_success()
+    limiter.on_success()
+    assert limiter.requests_per_minute == 61  # Capped at max_rpm
+    limiter.on_throttle()
+    assert limiter.requests_per_minute == 30.5
+    limiter.on_throttle()
+    limiter.on_throttle()
+    assert limiter.requests_per_minute == 10  # Floored at min_rpm
+
+def test_throttles_within_the_cooldown_count_once():
+    limiter = AdaptiveRateLimiter("test", 60, min_rpm=1, decrease=0.5, cooldown=60)
+    limiter.on_throttle()
+    limiter.on_throttle()
+    assert limiter.requests_per_minute == 30
+
+def test_acquire_beyond_max_wait_takes_no_token():
+    limiter = AdaptiveRateLimiter("test", 2, burst=1, min_rpm=1)
+    assert limiter.acquire() == 0.0
+    before = tokens(limiter)
+    with pytest.raises(RateLimitExceeded) as raised:
+        limiter.acquire(max_wait=1)
+    assert raised.value.retry_after > 25  # About 30s per token at 2 rpm
+    assert tokens(limiter) == pytest.approx(before, abs=0.01)
+
+def test_limiters_on_the_same_file_share_one_bucket(tmp_path):
+    path = str(tmp_path / "limiter.sqlite3")
+    first = AdaptiveRateLimiter("generate", 2, burst=1, path=path)
+    second = AdaptiveRateLimiter("generate", 2, burst=1, path=path)
+    first.acquire()
+    with pytest.raises(RateLimitExceeded):
+        second.acquire(max_wait=1)
+    first.on_throttle()
+    assert second.requests_per_minute == first.requests_per_minute
+
+def test_call_with_retry_retries_throttling_until_it_succeeds():
+    limiter = AdaptiveRateLimiter("test", 6000, burst=10, cooldown=0)
+    answers = iter([ApiError(429), ApiError(503), "ok"])
+
+    def call():
+        answer = next(answers)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    assert call_with_retry(call, limiter, retries=3, base_delay=0.01) == "ok"
+    assert limiter.requests_per_minute < 6000
+
+def test_call_with_retry_raises_rate_limit_exceeded_after_the_retries():
+    calls = []
+
+    def call():
+        calls.append(1)
+        raise ApiError(429)
+
+    with pytest.raises(RateLimitExceeded):
+        call_with_retry(call, retries=2, base_delay=0.01)
+    assert len(calls) == 3
+
+def test_call_with_retry_does_not_retry_other_errors():
+    calls = []
+
+    def call():
+        calls.append(1)
+        raise ApiError(400, "prompt has 500 tokens")
+
+    with pytest.raises(ApiError):
+        call_with_retry(call, retries=5)
+    assert len(calls) == 1
+
+def test_call_with_retry_gives_up_at_the_deadline(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "backoff_delay", lambda attempt, base, cap: 10.0)
+    calls = []
+
+    def call():
+        calls.append(1)
+        raise ApiError(429)
+
+    start = time.monotonic()
+    with pytest.raises(RateLimitExceeded):
+        call_with_retry(call, retries=5, deadline=1)
+    assert len(calls) == 1
+    assert time.monotonic() - start < 1
+
+def test_error_status_ignores_numbers_in_messages():
+    assert error_status(Exception("prompt has 500 tokens")) is None
+    assert error_status(Exception("quota exhausted")) is None
+    assert error_status(ApiError(429)) == 429
+
+def test_error_status_reads_response_status():
+    class Response:
+        status_code = 503
+
+    class HttpError(Exception):
+        response = Response()
+
+    assert error_status(HttpError()) == 503
@@ -0,0 +1,133 @@
+import os
+import json
+import uuid
+import numpy as np
+from atomic_files import write_atomic, save_json
+
+
+class NumpyVectorIndex:
+    """In-process cosine-similarity index over the profile chunks.
+
+    Embeddings are held as an L2-normalised float32 matrix (memory-mapped
+    from an .npy snapshot when loaded from disk) with a parallel list of
+    payloads. search() returns documents shaped like the $vectorSearch
+    results of app.find_similar_documents.
+    """
+
+    def __init__(self, matrix: np.ndarray, payloads: list) -> None:
+        if len(matrix) != len(payloads):
+            raise ValueError("matrix and payloads must have the same length")
+        self.matrix = matrix
+        self.payloads = payloads
+
+    @staticmethod
+    def normalize(vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return np.ascontiguousarray(vectors / norms, dtype=np.float32)
+
+    @classmethod
+    def from_documents(cls, documents, embedding_field: str = "embeddings") -> "NumpyVectorIndex":
+        vectors, payloads = [], []
+        for document in documents:
+            embedding = document.get(embedding_field)
+            if embedding is None or not len(embedding):
+                continue
+            vectors.append(np.asarray(embedding, dtype=np.float32))
+            payload = {key: value for key, value in document.items() if key != embedding_field}
+            if "_id" in payload:
+                payload["_id"] = str(payload["_id"])
+            payloads.append(payload)
+
+        if not vectors:
+            return cls(np.empty((0, 0), dtype=np.float32), [])
+        return cls(cls.normalize(np.stack(vectors)), payloads)
+
+    def replace_chunks(self, documents, ids, embedding_field: str = "embeddings", id_field: str = "chunk_id") -> "NumpyVectorIndex":
+        """New index without the rows whose `id_field` is in `ids`, plus `documents`."""
+        dropped = set(ids)
+        keep = [i for i, payload in enumerate(self.payloads) if payload.get(id_field) not in dropped]
+        added = NumpyVectorIndex.from_documents(documents, embedding_field)
+        parts = [np.asarray(self.matrix[keep], dtype=np.float32)] if keep else []
+        if len(added):
+            parts.append(added.matrix)
+        if not parts:
+            return NumpyVectorIndex(np.empty((0, 0), dtype=np.float32), [])
+        matrix = np.ascontiguousarray(np.concatenate(parts), dtype=np.float32)
+        return NumpyVectorIndex(matrix, [self.payloads[i] for i in keep] + added.payloads)
+
+    def save(self, path: str) -> None:
+        """Write `<path>.<generation>.npy` (vectors) and `<path>.json` (payloads).
+
+        Both are renamed into place, the .json last. It names the matrix it
+        belongs to, so a reader that loads it never pairs new payloads with
+        an old matrix or the other way round, even while a save is running.
+        """
+        generation = uuid.uuid4().hex[:12]
+        matrix_file = f"{os.path.basename(path)}.{generation}.npy"
+        write_atomic(os.path.join(os.path.dirname(path), matrix_file), lambda f: np.save(f, self.matrix), mode='wb')
+        save_json(path + ".json", {"matrix": matrix_file, "payloads": self.payloads})
+
+        # Drop the matrices of earlier snapshots. One that is still open
+        # (memory-mapped on Windows) is left for the next save.
+        directory = os.path.dirname(path) or "."
+        prefix = os.path.basename(path) + "."
+        for name in os.listdir(directory):
+            if name.startswith(prefix) and name.endswith(".npy") and name != matrix_file:
+                try:
+                    os.remove(os.path.join(directory, name))
+                except OSError:
+                    pass
+
+    @classmethod
+    def load(cls, path: str, attempts: int = 3) -> "NumpyVectorIndex":
+        # The payloads are read first and name their matrix; if a concurrent
+        # save already removed it, read the newer payloads again
+        for attempt in range(attempts):
+            with open(path + ".json", "r") as f:
+                snapshot = json.load(f)
+            if isinstance(snapshot, list):
+                # Snapshot from before the matrix file was versioned
+                return cls(np.load(path + ".npy", mmap_mode="r"), snapshot)
+            try:
+                matrix = np.load(os.path.join(os.path.dirname(path), snapshot["matrix"]), mmap_mode="r")
+            except FileNotFoundError:
+                if attempt == attempts - 1:
+                    raise
+                continue
+            return cls(matrix, snapshot["payloads"])
+
+    @staticmethod
+    def exists(path: str) -> bool:
+        return os.path.exists(path + ".json")
+
+    def __len__(self) -> int:
+        return len(self.payloads)
+
+    def search(self, query_vector, no_of_docs: int = 3, query: dict = None) -> list:
+        if not len(self.payloads) or not len(query_vector):
+            return []
+
+        scores = self.matrix @ self.normalize(query_vector)
+        candidates = np.arange(len(scores))
+        if query:
+            # Plain equality filters, the only kind the chat endpoint uses
+            candidates = np.array([i for i in candidates
+                                   if all(self.payloads[i].get(k) == v for k, v in query.items())],
+                                  dtype=np.int64)
+            if not len(candidates):
+                return []
+
+        k = min(no_of_docs, len(candidates))
+        candidate_scores = scores[candidates]
+        top = np.argpartition(-candidate_scores, k - 1)[:k]
+        top = top[np.argsort(-candidate_scores[top])]
+
+        results = []
+        for position in top:
+            document = dict(self.payloads[candidates[position]])
+            # Same scale as Atlas' cosine vectorSearchScore
+            document["score"] = float((1.0 + candidate_scores[position]) / 2.0)
+            results.append(document)
+        return results